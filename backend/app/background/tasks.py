@@ -104,68 +104,68 @@ async def _sync_github_repository(repository, db, task_instance):
         
         task_instance.update_state(state='PROGRESS', meta={'progress': 30, 'status': 'Fetching commits'})
         
-        # Get commits since last sync with rate limiting delay
+        # Stream commits since last sync page by page with rate limiting delay
         await asyncio.sleep(1)  # Additional delay before commits API call
         since_date = repository.last_synced_at
-        commits_data = await github_client.get_commits(owner, repo_name, since=since_date)
         
-        total_commits = len(commits_data)
-        logger.info(f"Found {total_commits} commits to process")
+        task_instance.update_state(state='PROGRESS', meta={'progress': 40, 'status': 'Processing commits'})
         
-        task_instance.update_state(state='PROGRESS', meta={'progress': 40, 'status': f'Processing {total_commits} commits'})
+        # Stored SHAs; the client drops known commits and stops paginating at them.
+        # Kept current below: a push mid-sync shifts GitHub's offset pages, so a
+        # commit stored from one page can come back on the next
+        known_shas = {
+            sha for (sha,) in db.query(Commit.sha).filter(Commit.repository_id == repository.id)
+        }
         
         processed = 0
-        for commit_data in commits_data:
-            # Check if commit already exists
-            existing_commit = db.query(Commit).filter(
-                Commit.sha == commit_data.get('sha'),
-                Commit.repository_id == repository.id
-            ).first()
-            
-            if existing_commit:
-                continue
+        async for commits_page in github_client.iter_commits(owner, repo_name, since=since_date, known_shas=known_shas):
+            new_shas = [commit_data.get('sha') for commit_data in commits_page]
             
-            # Get detailed commit info
-            detailed_commit = await github_client.get_commit_details(owner, repo_name, commit_data.get('sha'))
-            parsed_commit = parse_commit_data(detailed_commit)
+            # Get detailed commit info for the whole page concurrently
+            detailed_commits = await github_client.get_commit_details_many(owner, repo_name, new_shas)
             
-            # Find or create developer
-            developer = _find_or_create_developer(db, parsed_commit['author_name'], parsed_commit['author_email'])
-            
-            # Create commit record
-            commit = Commit(
-                sha=parsed_commit['sha'],
-                message=parsed_commit['message'],
-                author_name=parsed_commit['author_name'],
-                author_email=parsed_commit['author_email'],
-                committer_name=parsed_commit['committer_name'],
-                committer_email=parsed_commit['committer_email'],
-                commit_date=parsed_commit['commit_date'],
-                repository_id=repository.id,
-                developer_id=developer.id if developer else None,
-                lines_added=parsed_commit['lines_added'],
-                lines_removed=parsed_commit['lines_removed'],
-                files_changed=parsed_commit['files_changed'],
-                files_modified=parsed_commit['files_modified'],
-                files_added=parsed_commit['files_added'],
-                files_deleted=parsed_commit['files_deleted'],
-                parent_shas=parsed_commit['parent_shas'],
-                is_merge=parsed_commit['is_merge']
-            )
+            for detailed_commit in detailed_commits:
+                parsed_commit = parse_commit_data(detailed_commit)
+                
+                # Find or create developer
+                developer = _find_or_create_developer(db, parsed_commit.author_name, parsed_commit.author_email)
+                
+                # Create commit record
+                commit = Commit(
+                    sha=parsed_commit.sha,
+                    message=parsed_commit.message,
+                    author_name=parsed_commit.author_name,
+                    author_email=parsed_commit.author_email,
+                    committer_name=parsed_commit.committer_name,
+                    committer_email=parsed_commit.committer_email,
+                    commit_date=parsed_commit.commit_date,
+                    repository_id=repository.id,
+                    developer_id=developer.id if developer else None,
+                    lines_added=parsed_commit.lines_added,
+                    lines_removed=parsed_commit.lines_removed,
+                    files_changed=parsed_commit.files_changed,
+                    files_modified=parsed_commit.files_modified,
+                    files_added=parsed_commit.files_added,
+                    files_deleted=parsed_commit.files_deleted,
+                    parent_shas=parsed_commit.parent_shas,
+                    is_merge=parsed_commit.is_merge
+                )
+                
+                db.add(commit)
+                processed += 1
             
-            db.add(commit)
-            processed += 1
+            # Persist each page as it arrives so memory stays bounded by the page size
+            db.commit()
+            known_shas.update(new_shas)
             
-            # Update progress
-            progress = 40 + int((processed / total_commits) * 50)
+            # Update progress (pagination is capped at 1000 commits per sync)
+            progress = 40 + int((min(processed, 1000) / 1000) * 50)
             task_instance.update_state(state='PROGRESS', meta={
-                'progress': progress, 
-                'status': f'Processed {processed}/{total_commits} commits'
+                'progress': progress,
+                'status': f'Processed {processed} new commits'
             })
-            
-            # Commit in batches to avoid memory issues
-            if processed % 50 == 0:
-                db.commit()
+        
+        logger.info(f"Stored {processed} new commits")
         
         db.commit()
         task_instance.update_state(state='PROGRESS', meta={'progress': 95, 'status': 'Finalizing sync'})
@@ -194,6 +194,23 @@ def _find_or_create_developer(db, name: str, email: str):
     
     return developer
 
+# Keep IN (...) lists well below driver bind-parameter limits
+ANALYZED_UPDATE_CHUNK_SIZE = 500
+
+def _mark_commits_analyzed(db, commit_ids: list):
+    """Flag commits as analyzed with one UPDATE per chunk of ids"""
+    from sqlalchemy import update
+    from app.models.commit import Commit
+    
+    for i in range(0, len(commit_ids), ANALYZED_UPDATE_CHUNK_SIZE):
+        chunk = commit_ids[i:i + ANALYZED_UPDATE_CHUNK_SIZE]
+        db.execute(
+            update(Commit)
+            .where(Commit.id.in_(chunk))
+            .values(is_analyzed=True)
+            .execution_options(synchronize_session=False)
+        )
+
 @celery_app.task(bind=True)
 def analyze_commits(self, repository_id: int):
     """
@@ -220,6 +237,7 @@ def analyze_commits(self, repository_id: int):
         logger.info(f"Analyzing {total_commits} commits for repository {repository_id}")
         
         # TODO: Implement AI analysis logic
+        analyzed_ids = []
         for i, commit in enumerate(commits):
             self.update_state(
                 state='PROGRESS',
@@ -230,8 +248,9 @@ def analyze_commits(self, repository_id: int):
             )
             
             # Mark commit as analyzed (placeholder)
-            commit.is_analyzed = True
-            
+            analyzed_ids.append(commit.id)
+        
+        _mark_commits_analyzed(db, analyzed_ids)
         db.commit()
         
         logger.info(f"Successfully analyzed {total_commits} commits for repository {repository_id}")
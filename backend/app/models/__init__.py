@@ -6,7 +6,8 @@ from .developer import Developer
 from .analysis import CommitAnalysis
 from .github_user import GitHubUser
 from .github_organization import GitHubOrganization
+from .github_organization_secrets import GitHubOrganizationSecrets
 from .repository_selection import RepositorySelection
 
 __all__ = ["Base", "User", "Repository", "Commit", "Developer", "CommitAnalysis", 
-           "GitHubUser", "GitHubOrganization", "RepositorySelection"]
\ No newline at end of file
+           "GitHubUser", "GitHubOrganization", "GitHubOrganizationSecrets", "RepositorySelection"]
\ No newline at end of file
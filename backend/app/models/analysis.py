@@ -1,8 +1,9 @@
-from sqlalchemy import Column, Integer, String, DateTime, Boolean, Text, ForeignKey, Float, JSON, Enum
+from sqlalchemy import Column, Integer, String, DateTime, Boolean, Text, ForeignKey, Float, JSON, Enum, Index, event, select
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 import enum
 from app.database import Base
+from app.models.commit import Commit
 
 class CommitType(enum.Enum):
     FEATURE = "feature"
@@ -28,6 +29,12 @@ class CommitAnalysis(Base):
     id = Column(Integer, primary_key=True, index=True)
     commit_id = Column(Integer, ForeignKey("commits.id"), nullable=False)
     
+    # Denormalized from the commit so dashboards can aggregate without joining commits.
+    # No Alembic tree yet: existing databases need these columns added and backfilled
+    # from commits by hand (see the commit that introduced them for the SQL)
+    repository_id = Column(Integer, ForeignKey("repositories.id"), nullable=False, index=True)
+    commit_date = Column(DateTime(timezone=True), nullable=False)
+    
     # AI Classification
     commit_type = Column(Enum(CommitType), nullable=False)
     complexity_level = Column(Enum(ComplexityLevel), nullable=False)
@@ -47,7 +54,7 @@ class CommitAnalysis(Base):
     frameworks_detected = Column(JSON)  # Array of detected frameworks
     
     # Risk assessment
-    risk_level = Column(String(20))  # low, medium, high
+    risk_level = Column(String(8))  # low, medium, high
     risk_factors = Column(JSON)  # Array of risk factors
     
     # AI model information
@@ -64,4 +71,28 @@ class CommitAnalysis(Base):
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
     
     # Relationships
-    commit = relationship("Commit", back_populates="analysis")
\ No newline at end of file
+    commit = relationship("Commit", back_populates="analysis")
+    
+    __table_args__ = (
+        Index("ix_analysis_repo_date", "repository_id", "commit_date"),
+    )
+
+@event.listens_for(CommitAnalysis, "before_insert")
+def _copy_commit_fields(mapper, connection, target):
+    """Fill the denormalized commit columns at write time if the caller did not"""
+    if target.repository_id is not None and target.commit_date is not None:
+        return
+    
+    # Avoid a lazy load mid-flush: only use the commit object if it is already attached
+    commit = target.__dict__.get("commit")
+    if commit is not None:
+        repository_id, commit_date = commit.repository_id, commit.commit_date
+    else:
+        repository_id, commit_date = connection.execute(
+            select(Commit.repository_id, Commit.commit_date).where(Commit.id == target.commit_id)
+        ).one()
+    
+    if target.repository_id is None:
+        target.repository_id = repository_id
+    if target.commit_date is None:
+        target.commit_date = commit_date
\ No newline at end of file
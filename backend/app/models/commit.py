@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, DateTime, Boolean, Text, ForeignKey, JSON
+from sqlalchemy import Column, Integer, String, CHAR, DateTime, Boolean, Text, ForeignKey, JSON, Index, text
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 from app.database import Base
@@ -9,7 +9,7 @@ class Commit(Base):
     id = Column(Integer, primary_key=True, index=True)
     
     # Git commit information
-    sha = Column(String(40), unique=True, index=True, nullable=False)
+    sha = Column(CHAR(40), unique=True, index=True, nullable=False)
     message = Column(Text, nullable=False)
     author_name = Column(String(255), nullable=False)
     author_email = Column(String(255), nullable=False)
@@ -24,9 +24,9 @@ class Commit(Base):
     developer_id = Column(Integer, ForeignKey("developers.id"), nullable=True)
     
     # Commit metrics
-    lines_added = Column(Integer, default=0)
-    lines_removed = Column(Integer, default=0)
-    files_changed = Column(Integer, default=0)
+    lines_added = Column(Integer, nullable=False, default=0, server_default=text("0"))
+    lines_removed = Column(Integer, nullable=False, default=0, server_default=text("0"))
+    files_changed = Column(Integer, nullable=False, default=0, server_default=text("0"))
     
     # File changes (JSON array of file paths)
     files_modified = Column(JSON)
@@ -38,10 +38,10 @@ class Commit(Base):
     
     # Parent commits
     parent_shas = Column(JSON)  # Array of parent commit SHAs
-    is_merge = Column(Boolean, default=False)
+    is_merge = Column(Boolean, nullable=False, default=False, server_default=text("false"))
     
     # Processing status
-    is_analyzed = Column(Boolean, default=False)
+    is_analyzed = Column(Boolean, nullable=False, default=False, server_default=text("false"))
     
     # Timestamps
     created_at = Column(DateTime(timezone=True), server_default=func.now())
@@ -50,4 +50,14 @@ class Commit(Base):
     # Relationships
     repository = relationship("Repository", back_populates="commits")
     developer = relationship("Developer", back_populates="commits")
-    analysis = relationship("CommitAnalysis", back_populates="commit", uselist=False)
\ No newline at end of file
+    analysis = relationship("CommitAnalysis", back_populates="commit", uselist=False)
+    
+    __table_args__ = (
+        # Small index covering only the analysis backlog (see analyze_commits)
+        Index(
+            "ix_commits_unanalyzed",
+            "repository_id",
+            postgresql_where=text("is_analyzed = false"),
+            sqlite_where=text("is_analyzed = 0"),
+        ),
+    )
\ No newline at end of file
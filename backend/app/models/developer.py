@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, DateTime, Boolean, ForeignKey
+from sqlalchemy import Column, Integer, String, DateTime, Boolean, ForeignKey, text
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 from app.database import Base
@@ -18,9 +18,9 @@ class Developer(Base):
     git_email = Column(String(255))  # Email as it appears in git commits
     
     # Metadata
-    is_merged = Column(Boolean, default=False)  # If this identity is merged with another
+    is_merged = Column(Boolean, nullable=False, default=False, server_default=text("false"))  # If this identity is merged with another
     merged_with_id = Column(Integer, ForeignKey("developers.id"), nullable=True)
-    is_active = Column(Boolean, default=True)
+    is_active = Column(Boolean, nullable=False, default=True, server_default=text("true"))
     
     # Timestamps
     created_at = Column(DateTime(timezone=True), server_default=func.now())
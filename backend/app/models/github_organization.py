@@ -1,39 +1,35 @@
-from sqlalchemy import Column, Integer, String, DateTime, Boolean, Text, ForeignKey
+from sqlalchemy import Column, Integer, BigInteger, String, DateTime, Boolean, Text, ForeignKey, text
+from sqlalchemy.ext.associationproxy import association_proxy
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 from app.database import Base
+from app.models.github_organization_secrets import GitHubOrganizationSecrets
 
 class GitHubOrganization(Base):
     __tablename__ = "github_organizations"
 
     id = Column(Integer, primary_key=True, index=True)
     login = Column(String(255), nullable=False, index=True)  # GitHub org login name
-    github_id = Column(Integer, nullable=False, unique=True)  # GitHub's internal org ID
+    github_id = Column(BigInteger, nullable=False, unique=True)  # GitHub's internal org ID
     
     # Organization metadata from GitHub API
     display_name = Column(String(255))
     description = Column(Text)
     email = Column(String(255))
-    avatar_url = Column(String(512))
-    blog = Column(String(512))
+    avatar_url = Column(String(255))
+    blog = Column(String(255))
     location = Column(String(255))
     company = Column(String(255))
     
     # Organization stats
-    public_repos = Column(Integer, default=0)
-    public_gists = Column(Integer, default=0)
-    followers = Column(Integer, default=0)
-    following = Column(Integer, default=0)
-    
-    # Access tokens for private repositories (OAuth)
-    access_token = Column(Text)  # Encrypted OAuth token
-    token_expires_at = Column(DateTime(timezone=True))
-    refresh_token = Column(Text)  # For token refresh
-    scopes = Column(Text)  # Comma-separated list of granted scopes
+    public_repos = Column(Integer, nullable=False, default=0, server_default=text("0"))
+    public_gists = Column(Integer, nullable=False, default=0, server_default=text("0"))
+    followers = Column(Integer, nullable=False, default=0, server_default=text("0"))
+    following = Column(Integer, nullable=False, default=0, server_default=text("0"))
     
     # Monitoring configuration
-    is_active = Column(Boolean, default=True)
-    auto_sync = Column(Boolean, default=True)
+    is_active = Column(Boolean, nullable=False, default=True, server_default=text("true"))
+    auto_sync = Column(Boolean, nullable=False, default=True, server_default=text("true"))
     last_synced_at = Column(DateTime(timezone=True))
     
     # Access control
@@ -45,4 +41,24 @@ class GitHubOrganization(Base):
     
     # Relationships
     added_by = relationship("User", foreign_keys=[added_by_user_id])
-    repository_selections = relationship("RepositorySelection", back_populates="github_organization")
\ No newline at end of file
+    repository_selections = relationship("RepositorySelection", back_populates="github_organization")
+    
+    # OAuth credentials live in a side table and are only loaded when accessed
+    secrets = relationship(
+        "GitHubOrganizationSecrets",
+        back_populates="organization",
+        uselist=False,
+        cascade="all, delete-orphan"
+    )
+    access_token = association_proxy(
+        "secrets", "access_token", creator=lambda value: GitHubOrganizationSecrets(access_token=value)
+    )
+    token_expires_at = association_proxy(
+        "secrets", "token_expires_at", creator=lambda value: GitHubOrganizationSecrets(token_expires_at=value)
+    )
+    refresh_token = association_proxy(
+        "secrets", "refresh_token", creator=lambda value: GitHubOrganizationSecrets(refresh_token=value)
+    )
+    scopes = association_proxy(
+        "secrets", "scopes", creator=lambda value: GitHubOrganizationSecrets(scopes=value)
+    )
\ No newline at end of file
@@ -0,0 +1,23 @@
+from sqlalchemy import Column, Integer, DateTime, Text, ForeignKey
+from sqlalchemy.orm import relationship
+from sqlalchemy.sql import func
+from app.database import Base
+
+class GitHubOrganizationSecrets(Base):
+    """OAuth credentials for a GitHubOrganization, kept out of the hot row (1:1)"""
+    __tablename__ = "github_organization_secrets"
+
+    organization_id = Column(Integer, ForeignKey("github_organizations.id", ondelete="CASCADE"), primary_key=True)
+    
+    # Access tokens for private repositories (OAuth)
+    access_token = Column(Text)  # Encrypted OAuth token
+    token_expires_at = Column(DateTime(timezone=True))
+    refresh_token = Column(Text)  # For token refresh
+    scopes = Column(Text)  # Comma-separated list of granted scopes
+    
+    # Timestamps
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    updated_at = Column(DateTime(timezone=True), onupdate=func.now())
+    
+    # Relationships
+    organization = relationship("GitHubOrganization", back_populates="secrets")
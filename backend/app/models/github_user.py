@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, DateTime, Boolean, Text, ForeignKey
+from sqlalchemy import Column, Integer, BigInteger, String, DateTime, Boolean, Text, ForeignKey, text
 from sqlalchemy.orm import relationship  
 from sqlalchemy.sql import func
 from app.database import Base
@@ -8,26 +8,26 @@ class GitHubUser(Base):
 
     id = Column(Integer, primary_key=True, index=True)
     username = Column(String(255), nullable=False, index=True)
-    github_id = Column(Integer, nullable=False, unique=True)  # GitHub's internal user ID
+    github_id = Column(BigInteger, nullable=False, unique=True)  # GitHub's internal user ID
     
     # User metadata from GitHub API
     display_name = Column(String(255))
     email = Column(String(255))
-    avatar_url = Column(String(512))
+    avatar_url = Column(String(255))
     bio = Column(Text)
     company = Column(String(255))
     location = Column(String(255))
-    blog = Column(String(512))
+    blog = Column(String(255))
     
     # Repository stats
-    public_repos = Column(Integer, default=0)
-    public_gists = Column(Integer, default=0)
-    followers = Column(Integer, default=0)
-    following = Column(Integer, default=0)
+    public_repos = Column(Integer, nullable=False, default=0, server_default=text("0"))
+    public_gists = Column(Integer, nullable=False, default=0, server_default=text("0"))
+    followers = Column(Integer, nullable=False, default=0, server_default=text("0"))
+    following = Column(Integer, nullable=False, default=0, server_default=text("0"))
     
     # Monitoring configuration
-    is_active = Column(Boolean, default=True)
-    auto_sync = Column(Boolean, default=True)  # Auto-sync new repositories
+    is_active = Column(Boolean, nullable=False, default=True, server_default=text("true"))
+    auto_sync = Column(Boolean, nullable=False, default=True, server_default=text("true"))  # Auto-sync new repositories
     last_synced_at = Column(DateTime(timezone=True))
     
     # Access control
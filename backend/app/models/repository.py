@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, DateTime, Boolean, Text, ForeignKey, Enum
+from sqlalchemy import Column, Integer, String, DateTime, Boolean, Text, ForeignKey, Enum, text
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 import enum
@@ -24,8 +24,8 @@ class Repository(Base):
     # Repository metadata
     description = Column(Text)
     default_branch = Column(String(100), default="main")
-    is_private = Column(Boolean, default=False)
-    is_active = Column(Boolean, default=True)
+    is_private = Column(Boolean, nullable=False, default=False, server_default=text("false"))
+    is_active = Column(Boolean, nullable=False, default=True, server_default=text("true"))
     
     # Sync information
     last_synced_at = Column(DateTime(timezone=True))
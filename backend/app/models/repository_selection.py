@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, DateTime, Boolean, Text, ForeignKey, Enum
+from sqlalchemy import Column, Integer, BigInteger, String, DateTime, Boolean, Text, ForeignKey, Enum, text
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 import enum
@@ -16,22 +16,22 @@ class RepositorySelection(Base):
     id = Column(Integer, primary_key=True, index=True)
     
     # Repository information from GitHub API
-    github_repo_id = Column(Integer, nullable=False)  # GitHub's internal repo ID
+    github_repo_id = Column(BigInteger, nullable=False)  # GitHub's internal repo ID
     name = Column(String(255), nullable=False)
     full_name = Column(String(512), nullable=False)  # e.g., "owner/repo"
     description = Column(Text)
     url = Column(String(512), nullable=False)
     clone_url = Column(String(512))
     default_branch = Column(String(100), default="main")
-    is_private = Column(Boolean, default=False)
-    is_fork = Column(Boolean, default=False)
-    is_archived = Column(Boolean, default=False)
+    is_private = Column(Boolean, nullable=False, default=False, server_default=text("false"))
+    is_fork = Column(Boolean, nullable=False, default=False, server_default=text("false"))
+    is_archived = Column(Boolean, nullable=False, default=False, server_default=text("false"))
     
     # Repository stats
-    stargazers_count = Column(Integer, default=0)
-    watchers_count = Column(Integer, default=0) 
-    forks_count = Column(Integer, default=0)
-    size = Column(Integer, default=0)  # Size in KB
+    stargazers_count = Column(Integer, nullable=False, default=0, server_default=text("0"))
+    watchers_count = Column(Integer, nullable=False, default=0, server_default=text("0")) 
+    forks_count = Column(Integer, nullable=False, default=0, server_default=text("0"))
+    size = Column(Integer, nullable=False, default=0, server_default=text("0"))  # Size in KB
     language = Column(String(100))
     
     # Selection status
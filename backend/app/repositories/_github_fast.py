@@ -0,0 +1,79 @@
+"""
+Hot-path parsing of GitHub commit payloads.
+
+Kept free of dynamic attribute access and fully annotated so the module can
+be compiled with mypyc (``mypyc app/repositories/_github_fast.py``); it runs
+unchanged as plain Python otherwise. Import from ``app.repositories.github``.
+"""
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+@dataclass(slots=True, frozen=True)
+class ParsedCommit:
+    """Commit fields extracted from a GitHub commit payload"""
+    sha: Optional[str]
+    message: str
+    author_name: str
+    author_email: str
+    committer_name: str
+    committer_email: str
+    commit_date: datetime
+    lines_added: int
+    lines_removed: int
+    files_changed: int
+    files_modified: List[Optional[str]]
+    files_added: List[Optional[str]]
+    files_deleted: List[Optional[str]]
+    parent_shas: List[Optional[str]]
+    is_merge: bool
+
+def _parse_dt(value: str) -> datetime:
+    """Parse a GitHub ISO-8601 timestamp (``Z`` suffix) into an aware datetime"""
+    return datetime.fromisoformat(value.replace('Z', '+00:00'))
+
+def parse_commit_data(commit_data: Dict[str, Any]) -> ParsedCommit:
+    """Parse GitHub commit data into our internal format"""
+    commit: Dict[str, Any] = commit_data.get('commit', {})
+    author: Dict[str, Any] = commit.get('author', {})
+    committer: Dict[str, Any] = commit.get('committer', {})
+    files: List[Dict[str, Any]] = commit_data.get('files', [])
+    parents: List[Dict[str, Any]] = commit_data.get('parents', [])
+    
+    # Parse file statistics and changes in a single pass
+    lines_added = 0
+    lines_removed = 0
+    files_modified: List[Optional[str]] = []
+    files_added: List[Optional[str]] = []
+    files_deleted: List[Optional[str]] = []
+    
+    for file_data in files:
+        lines_added += file_data.get('additions', 0)
+        lines_removed += file_data.get('deletions', 0)
+        filename: Optional[str] = file_data.get('filename')
+        status = file_data.get('status')
+        
+        if status == 'added':
+            files_added.append(filename)
+        elif status == 'removed':
+            files_deleted.append(filename)
+        else:
+            files_modified.append(filename)
+    
+    return ParsedCommit(
+        sha=commit_data.get('sha'),
+        message=commit.get('message', ''),
+        author_name=author.get('name', ''),
+        author_email=author.get('email', ''),
+        committer_name=committer.get('name', ''),
+        committer_email=committer.get('email', ''),
+        commit_date=_parse_dt(author.get('date', '')),
+        lines_added=lines_added,
+        lines_removed=lines_removed,
+        files_changed=len(files),
+        files_modified=files_modified,
+        files_added=files_added,
+        files_deleted=files_deleted,
+        parent_shas=[p.get('sha') for p in parents],
+        is_merge=len(parents) > 1
+    )
@@ -1,26 +1,60 @@
 """
 GitHub API integration for repository syncing
 """
+import asyncio
 import httpx
-from typing import List, Dict, Optional
+import time
+from contextlib import aclosing
+from typing import AsyncIterator, List, Dict, Optional, Set
 from datetime import datetime
 import logging
 
 from app.config import settings
+from app.repositories._github_fast import ParsedCommit, parse_commit_data
 
 logger = logging.getLogger(__name__)
 
+# Concurrent requests per client when fetching commit details
+MAX_CONCURRENT_REQUESTS = 10
+# Retries for a single request rejected by GitHub's primary/secondary rate limits
+MAX_RATE_LIMIT_RETRIES = 3
+# GitHub asks clients to wait at least a minute when no retry hint is given
+DEFAULT_RATE_LIMIT_DELAY = 60
+
+def _rate_limit_delay(response: httpx.Response) -> Optional[float]:
+    """Seconds to wait before retrying a rate-limited response, or None if it is not rate limited"""
+    retry_after = response.headers.get("Retry-After")
+    if retry_after is not None:
+        try:
+            return max(float(retry_after), 0.0)
+        except ValueError:
+            return DEFAULT_RATE_LIMIT_DELAY
+    
+    if response.headers.get("X-RateLimit-Remaining") == "0":
+        reset_at = response.headers.get("X-RateLimit-Reset")
+        if reset_at and reset_at.isdigit():
+            return max(int(reset_at) - time.time(), 0.0)
+        return DEFAULT_RATE_LIMIT_DELAY
+    
+    if response.status_code == 429:
+        return DEFAULT_RATE_LIMIT_DELAY
+    
+    # A plain 403 is a permissions error, not something to wait out
+    return None
+
 class GitHubClient:
     def __init__(self, access_token: Optional[str] = None):
         self.access_token = access_token
         self.base_url = "https://api.github.com"
-        self.headers = {
-            "Accept": "application/vnd.github.v3+json",
+        
+        # Built once so httpx does not re-normalize a plain dict on every request
+        headers = {
+            "Accept": "application/vnd.github+json",
             "User-Agent": "GitAnalyzer/1.0"
         }
-        
         if self.access_token:
-            self.headers["Authorization"] = f"token {self.access_token}"
+            headers["Authorization"] = f"token {self.access_token}"
+        self.headers = httpx.Headers(headers)
     
     async def get_repository_info(self, owner: str, repo: str) -> Dict:
         """Get basic repository information"""
@@ -31,98 +65,124 @@ class GitHubClient:
             response.raise_for_status()
             return response.json()
     
-    async def get_commits(self, owner: str, repo: str, since: Optional[datetime] = None, per_page: int = 100) -> List[Dict]:
-        """Get repository commits"""
-        url = f"{self.base_url}/repos/{owner}/{repo}/commits"
-        params = {"per_page": per_page}
-        
-        if since:
-            params["since"] = since.isoformat()
-        
-        commits = []
+    async def _iter_pages(self, url: str, params: Dict, max_items: int = 1000) -> AsyncIterator[List[Dict]]:
+        """Yield successive pages from a paginated GitHub list endpoint"""
+        params = dict(params)
         page = 1
+        fetched = 0
         
         async with httpx.AsyncClient() as client:
             while True:
                 params["page"] = page
-                response = await client.get(url, headers=self.headers, params=params)
-                response.raise_for_status()
+                response = await self._get_with_retry(client, url, params=params)
                 
-                page_commits = response.json()
-                if not page_commits:
+                page_items = response.json()
+                if not page_items:
                     break
-                    
-                commits.extend(page_commits)
+                
+                yield page_items
+                fetched += len(page_items)
                 page += 1
                 
                 # Limit to prevent rate limiting
-                if len(commits) >= 1000:
+                if fetched >= max_items:
                     break
+    
+    async def iter_commits(self, owner: str, repo: str, since: Optional[datetime] = None, per_page: int = 100,
+                           known_shas: Optional[Set[str]] = None) -> AsyncIterator[List[Dict]]:
+        """Stream repository commits one page at a time
         
-        return commits
+        When known_shas is given, already-stored commits are dropped from each page and
+        pagination stops at the first page whose oldest commit is already known.
+        """
+        url = f"{self.base_url}/repos/{owner}/{repo}/commits"
+        params = {"per_page": per_page}
+        
+        if since:
+            params["since"] = since.isoformat()
+        
+        async with aclosing(self._iter_pages(url, params)) as pages:
+            async for page_commits in pages:
+                if not known_shas:
+                    yield page_commits
+                    continue
+                
+                reached_known = page_commits[-1].get("sha") in known_shas
+                yield [c for c in page_commits if c.get("sha") not in known_shas]
+                
+                if reached_known:
+                    break
+    
+    async def get_commits(self, owner: str, repo: str, since: Optional[datetime] = None, per_page: int = 100,
+                          known_shas: Optional[Set[str]] = None) -> List[Dict]:
+        """Get repository commits"""
+        return [
+            c
+            async for page in self.iter_commits(owner, repo, since=since, per_page=per_page, known_shas=known_shas)
+            for c in page
+        ]
+    
+    async def _get_with_retry(self, client: httpx.AsyncClient, url: str, params: Optional[Dict] = None) -> httpx.Response:
+        """GET a URL, backing off and retrying when GitHub reports a rate limit"""
+        for attempt in range(MAX_RATE_LIMIT_RETRIES + 1):
+            response = await client.get(url, headers=self.headers, params=params)
+            
+            if response.status_code in (403, 429) and attempt < MAX_RATE_LIMIT_RETRIES:
+                delay = _rate_limit_delay(response)
+                if delay is not None:
+                    logger.warning(f"GitHub rate limit hit for {url}, retrying in {delay:.0f}s")
+                    await asyncio.sleep(delay)
+                    continue
+            
+            response.raise_for_status()
+            return response
+    
+    async def _fetch_commit_details(self, client: httpx.AsyncClient, owner: str, repo: str, sha: str) -> Dict:
+        url = f"{self.base_url}/repos/{owner}/{repo}/commits/{sha}"
+        response = await self._get_with_retry(client, url)
+        return response.json()
     
     async def get_commit_details(self, owner: str, repo: str, sha: str) -> Dict:
         """Get detailed commit information including file changes"""
-        url = f"{self.base_url}/repos/{owner}/{repo}/commits/{sha}"
+        async with httpx.AsyncClient() as client:
+            return await self._fetch_commit_details(client, owner, repo, sha)
+    
+    async def get_commit_details_many(self, owner: str, repo: str, shas: List[str]) -> List[Dict]:
+        """Get detailed commit information for many commits concurrently, in input order"""
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
         
         async with httpx.AsyncClient() as client:
-            response = await client.get(url, headers=self.headers)
-            response.raise_for_status()
-            return response.json()
+            async def fetch(sha: str) -> Dict:
+                async with semaphore:
+                    return await self._fetch_commit_details(client, owner, repo, sha)
+            
+            return await asyncio.gather(*(fetch(sha) for sha in shas))
     
-    async def get_user_repositories(self, username: str, per_page: int = 100) -> List[Dict]:
-        """Get all public repositories for a GitHub user"""
+    async def iter_user_repositories(self, username: str, per_page: int = 100) -> AsyncIterator[List[Dict]]:
+        """Stream public repositories for a GitHub user one page at a time"""
         url = f"{self.base_url}/users/{username}/repos"
         params = {"per_page": per_page, "sort": "updated", "direction": "desc"}
         
-        repos = []
-        page = 1
-        
-        async with httpx.AsyncClient() as client:
-            while True:
-                params["page"] = page
-                response = await client.get(url, headers=self.headers, params=params)
-                response.raise_for_status()
-                
-                page_repos = response.json()
-                if not page_repos:
-                    break
-                    
-                repos.extend(page_repos)
-                page += 1
-                
-                # Limit to prevent rate limiting
-                if len(repos) >= 1000:
-                    break
-        
-        return repos
+        async with aclosing(self._iter_pages(url, params)) as pages:
+            async for page_repos in pages:
+                yield page_repos
     
-    async def get_organization_repositories(self, org: str, per_page: int = 100) -> List[Dict]:
-        """Get all repositories for a GitHub organization"""
+    async def get_user_repositories(self, username: str, per_page: int = 100) -> List[Dict]:
+        """Get all public repositories for a GitHub user"""
+        return [r async for page in self.iter_user_repositories(username, per_page=per_page) for r in page]
+    
+    async def iter_organization_repositories(self, org: str, per_page: int = 100) -> AsyncIterator[List[Dict]]:
+        """Stream repositories for a GitHub organization one page at a time"""
         url = f"{self.base_url}/orgs/{org}/repos"
         params = {"per_page": per_page, "sort": "updated", "direction": "desc"}
         
-        repos = []
-        page = 1
-        
-        async with httpx.AsyncClient() as client:
-            while True:
-                params["page"] = page
-                response = await client.get(url, headers=self.headers, params=params)
-                response.raise_for_status()
-                
-                page_repos = response.json()
-                if not page_repos:
-                    break
-                    
-                repos.extend(page_repos)
-                page += 1
-                
-                # Limit to prevent rate limiting
-                if len(repos) >= 1000:
-                    break
-        
-        return repos
+        async with aclosing(self._iter_pages(url, params)) as pages:
+            async for page_repos in pages:
+                yield page_repos
+    
+    async def get_organization_repositories(self, org: str, per_page: int = 100) -> List[Dict]:
+        """Get all repositories for a GitHub organization"""
+        return [r async for page in self.iter_organization_repositories(org, per_page=per_page) for r in page]
     
     async def get_user_organizations(self, username: str = None) -> List[Dict]:
         """Get organizations for a user (or authenticated user if no username provided)"""
@@ -150,48 +210,3 @@ class GitHubClient:
                 return parts[0], parts[1]
         
         raise ValueError(f"Invalid GitHub repository URL: {repo_url}")
-
-def parse_commit_data(commit_data: Dict) -> Dict:
-    """Parse GitHub commit data into our internal format"""
-    commit = commit_data.get('commit', {})
-    author = commit.get('author', {})
-    committer = commit.get('committer', {})
-    
-    # Parse file statistics if available
-    files_changed = len(commit_data.get('files', []))
-    lines_added = sum(f.get('additions', 0) for f in commit_data.get('files', []))
-    lines_removed = sum(f.get('deletions', 0) for f in commit_data.get('files', []))
-    
-    # Parse file changes
-    files_modified = []
-    files_added = []
-    files_deleted = []
-    
-    for file_data in commit_data.get('files', []):
-        filename = file_data.get('filename')
-        status = file_data.get('status')
-        
-        if status == 'added':
-            files_added.append(filename)
-        elif status == 'removed':
-            files_deleted.append(filename)
-        else:
-            files_modified.append(filename)
-    
-    return {
-        'sha': commit_data.get('sha'),
-        'message': commit.get('message', ''),
-        'author_name': author.get('name', ''),
-        'author_email': author.get('email', ''),
-        'committer_name': committer.get('name', ''),
-        'committer_email': committer.get('email', ''),
-        'commit_date': datetime.fromisoformat(author.get('date', '').replace('Z', '+00:00')),
-        'lines_added': lines_added,
-        'lines_removed': lines_removed,
-        'files_changed': files_changed,
-        'files_modified': files_modified,
-        'files_added': files_added,
-        'files_deleted': files_deleted,
-        'parent_shas': [p.get('sha') for p in commit_data.get('parents', [])],
-        'is_merge': len(commit_data.get('parents', [])) > 1
-    }
\ No newline at end of file
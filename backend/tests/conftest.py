@@ -1,77 +1,246 @@
+import functools
+import itertools
 import os
+import secrets
+from contextvars import ContextVar
+from datetime import timedelta
+from types import MappingProxyType
+import httpx
 import pytest
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import Session
+from sqlalchemy.pool import StaticPool
 from fastapi.testclient import TestClient
+from passlib.context import CryptContext
 from faker import Faker
 
-from app.main import app
+# Test database URL - using a named, shared-cache SQLite in-memory DB so every
+# connection (including ones opened from TestClient threads) sees the same data.
+# Each pytest-xdist worker gets its own database name.
+_WORKER = os.environ.get("PYTEST_XDIST_WORKER", "gw0")
+TEST_DATABASE_URL = f"sqlite+pysqlite:///file:pytest_{_WORKER}?mode=memory&cache=shared&uri=true"
+
+# Cheap bcrypt for tests; read into settings.bcrypt_rounds, so it must be set
+# before app.config is imported
+os.environ.setdefault("BCRYPT_ROUNDS", "4")
+# Point the app's own engine (used by the startup create_all) at the same
+# in-memory DB. Overwritten, not defaulted: docker-compose already sets
+# DATABASE_URL to the dev Postgres database inside the backend container.
+os.environ["DATABASE_URL"] = TEST_DATABASE_URL
+
 from app.database import Base, get_db
 from app.models.user import User
 from app.models.github_user import GitHubUser
 from app.models.github_organization import GitHubOrganization
 from app.models.repository import Repository
 from app.models.repository_selection import RepositorySelection
-from app.api.auth import get_password_hash
-
-# Test database URL - using SQLite in memory for fast tests
-TEST_DATABASE_URL = "sqlite:///:memory:"
+from app.api import auth
+from app.api.auth import create_access_token, get_password_hash
 
 fake = Faker()
+Faker.seed(0)
+
+# Faker is slow per call; draw test data from pools generated once at import
+_POOL_SIZE = 256
+_usernames = itertools.cycle([fake.unique.user_name() for _ in range(_POOL_SIZE)])
+_emails = itertools.cycle([fake.unique.email() for _ in range(_POOL_SIZE)])
+_names = itertools.cycle([fake.name() for _ in range(_POOL_SIZE)])
+# Opaque 40-char tokens; no need to run them through Faker and SHA-256
+_tokens = itertools.cycle([secrets.token_hex(20) for _ in range(_POOL_SIZE)])
+_github_ids = itertools.cycle([fake.unique.random_int(min=1000, max=999999) for _ in range(_POOL_SIZE)])
+_counts = itertools.cycle([fake.random_int(min=5, max=100) for _ in range(_POOL_SIZE)])
+_image_urls = itertools.cycle([fake.image_url() for _ in range(_POOL_SIZE)])
+_companies = itertools.cycle([fake.unique.company() for _ in range(_POOL_SIZE)])
+_slugs = itertools.cycle([fake.unique.slug() for _ in range(_POOL_SIZE)])
+_sentences = itertools.cycle([fake.sentence() for _ in range(_POOL_SIZE)])
+_urls = itertools.cycle([fake.unique.url() for _ in range(_POOL_SIZE)])
+
+# Session used by the current test; read by the app's get_db override
+_current_session: ContextVar[Session] = ContextVar("_current_session")
+
+# bcrypt is deliberately slow; fixture passwords come from a tiny fixed set
+_cached_hash = functools.lru_cache(maxsize=64)(get_password_hash)
+
+# PYTEST_FAST=1 swaps bcrypt for a plaintext scheme; tests marked real_bcrypt keep bcrypt
+PYTEST_FAST = os.environ.get("PYTEST_FAST") == "1"
+_BCRYPT_CONTEXT = auth.pwd_context
+
+TEST_PASSWORD = "testpassword123"
+INACTIVE_PASSWORD = "password123"
+
+@pytest.fixture(scope="session", autouse=True)
+def _fast_password_context():
+    """Use a plaintext password scheme for the whole session when PYTEST_FAST=1"""
+    if not PYTEST_FAST:
+        yield
+        return
+    
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(auth, "pwd_context", CryptContext(schemes=["plaintext"]))
+        yield
+
+@pytest.fixture(autouse=True)
+def _real_bcrypt(request, monkeypatch):
+    """Restore the bcrypt context for tests marked real_bcrypt"""
+    if PYTEST_FAST and request.node.get_closest_marker("real_bcrypt"):
+        monkeypatch.setattr(auth, "pwd_context", _BCRYPT_CONTEXT)
 
 @pytest.fixture(scope="session")
 def test_engine():
     """Create test database engine"""
     engine = create_engine(
         TEST_DATABASE_URL,
-        connect_args={"check_same_thread": False}  # Required for SQLite
+        poolclass=StaticPool,
+        connect_args={"check_same_thread": False, "uri": True}  # Required for SQLite
     )
+    
+    # pysqlite's own transaction handling breaks SAVEPOINTs; let SQLAlchemy emit BEGIN
+    @event.listens_for(engine, "connect")
+    def disable_pysqlite_transactions(dbapi_connection, connection_record):
+        dbapi_connection.isolation_level = None
+    
+    # Durability is irrelevant for a throwaway DB; WAL is unavailable in memory
+    @event.listens_for(engine, "connect")
+    def set_sqlite_pragmas(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        cursor.execute("PRAGMA synchronous=OFF")
+        # Not OFF: without a rollback journal SAVEPOINT rollback is undefined
+        cursor.execute("PRAGMA journal_mode=MEMORY")
+        cursor.execute("PRAGMA temp_store=MEMORY")
+        cursor.execute("PRAGMA locking_mode=EXCLUSIVE")
+        cursor.close()
+    
+    @event.listens_for(engine, "begin")
+    def emit_begin(conn):
+        conn.exec_driver_sql("BEGIN")
+    
     Base.metadata.create_all(bind=engine)
     return engine
 
+@pytest.fixture(scope="session")
+def connection(test_engine):
+    """Open one connection and outer transaction shared by the whole test session"""
+    conn = test_engine.connect()
+    trans = conn.begin()
+    try:
+        yield conn
+    finally:
+        trans.rollback()
+        conn.close()
+
 @pytest.fixture(scope="function")
-def test_db(test_engine):
-    """Create test database session"""
-    TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=test_engine)
-    db = TestingSessionLocal()
+def test_db(connection):
+    """Create test database session, rolled back to a SAVEPOINT after each test"""
+    savepoint = connection.begin_nested()
+    # commit()/rollback() in the test only release or roll back inner SAVEPOINTs
+    db = Session(
+        bind=connection,
+        autoflush=False,
+        expire_on_commit=False,
+        join_transaction_mode="create_savepoint"
+    )
     
-    # Clean up tables before each test
-    for table in reversed(Base.metadata.sorted_tables):
-        db.execute(table.delete())
-    db.commit()
+    token = _current_session.set(db)
     
     try:
         yield db
     finally:
+        _current_session.reset(token)
         db.close()
+        savepoint.rollback()
 
-@pytest.fixture(scope="function")
-def client(test_db):
-    """Create test client with test database"""
-    def override_get_db():
-        try:
-            yield test_db
-        finally:
-            pass
+@pytest.fixture(scope="module")
+def test_db_module(connection):
+    """Create a database session for module-scoped data, rolled back after the module"""
+    savepoint = connection.begin_nested()
+    db = Session(
+        bind=connection,
+        autoflush=False,
+        expire_on_commit=False,
+        join_transaction_mode="create_savepoint"
+    )
     
-    app.dependency_overrides[get_db] = override_get_db
+    try:
+        yield db
+    finally:
+        db.close()
+        savepoint.rollback()
+
+# Pre-rendered DELETEs, children first. Not run through executescript(): pysqlite
+# COMMITs before running a script, which would end the test's SAVEPOINT.
+_TRUNCATE_SQL = [(table, f"DELETE FROM {table.name}") for table in reversed(Base.metadata.sorted_tables)]
+
+def _truncate_all(conn, keep=()):
+    """Empty every table except those in keep"""
+    for table, sql in _TRUNCATE_SQL:
+        if table not in keep:
+            conn.exec_driver_sql(sql)
+
+@pytest.fixture(scope="function")
+def fresh_db(connection, test_db):
+    """Opt-in clean slate for tests that assert on empty tables"""
+    # Deleted inside the test's SAVEPOINT, so rows come back on teardown;
+    # users are kept so session-scoped fixtures like admin_user stay valid
+    _truncate_all(connection, keep=(User.__table__,))
+    return test_db
+
+def _bulk_create(db, *objs):
+    """Insert fixture objects with a flush; the test's SAVEPOINT keeps them visible"""
+    db.add_all(objs)
+    db.flush()
+
+@functools.lru_cache(maxsize=None)
+def _get_app():
+    """Import the FastAPI app on first use so pure unit tests skip it"""
+    from app.main import app
+    return app
+
+@functools.lru_cache(maxsize=None)
+def _routes():
+    """Collect the app's (path, method) pairs once"""
+    return {(route.path, method) for route in _get_app().routes for method in getattr(route, "methods", ())}
+
+def skip_if_no_route(path, method):
+    """Mark a test to be skipped when the app has no such endpoint"""
+    return pytest.mark.requires_route(path, method)
+
+@pytest.fixture(autouse=True)
+def _skip_missing_route(request):
+    """Check requires_route markers at run time, so collecting tests never imports the app"""
+    for marker in request.node.iter_markers("requires_route"):
+        if tuple(marker.args) not in _routes():
+            pytest.skip("endpoint not implemented")
+
+def _override_get_db():
+    yield _current_session.get()
+
+@pytest.fixture(scope="session")
+def _client():
+    """Create one test client per session so app startup/shutdown run only once"""
+    app = _get_app()
+    app.dependency_overrides[get_db] = _override_get_db
     
     with TestClient(app) as test_client:
         yield test_client
     
     app.dependency_overrides.clear()
 
+@pytest.fixture(scope="function")
+def client(_client, test_db):
+    """Create test client with test database"""
+    return _client
+
 # User fixtures
-@pytest.fixture
+@pytest.fixture(scope="session")
 def test_user_data():
-    """Generate test user data"""
-    return {
-        "username": fake.user_name(),
-        "email": fake.email(),
-        "password": "testpassword123",
-        "full_name": fake.name(),
-        "github_token": fake.sha256()[:40]  # Simulate GitHub token
-    }
+    """Generate test user data once per session; read-only since every test shares it"""
+    return MappingProxyType({
+        "username": next(_usernames),
+        "email": next(_emails),
+        "password": TEST_PASSWORD,
+        "full_name": next(_names),
+        "github_token": next(_tokens)  # Simulate GitHub token
+    })
 
 @pytest.fixture
 def test_user(test_db, test_user_data):
@@ -79,60 +248,110 @@ def test_user(test_db, test_user_data):
     user = User(
         username=test_user_data["username"],
         email=test_user_data["email"],
-        hashed_password=get_password_hash(test_user_data["password"]),
+        hashed_password=_cached_hash(test_user_data["password"]),
         full_name=test_user_data["full_name"],
         github_token=test_user_data["github_token"],
         is_active=True
     )
-    test_db.add(user)
-    test_db.commit()
-    test_db.refresh(user)
+    _bulk_create(test_db, user)
     return user
 
-@pytest.fixture
-def admin_user(test_db):
-    """Create an admin user for testing"""
+@pytest.fixture(scope="module")
+def module_user(test_db_module):
+    """Create a user that owns module-scoped rows; rolled back with test_db_module"""
+    user = User(
+        username="module_owner",
+        email="module_owner@example.com",
+        hashed_password=_cached_hash(TEST_PASSWORD),
+        full_name="Module Owner"
+    )
+    test_db_module.add(user)
+    test_db_module.commit()
+    return user
+
+@pytest.fixture(scope="session")
+def admin_user(connection):
+    """Create an admin user once; it lives in the outer transaction and survives per-test rollbacks"""
+    db = Session(bind=connection, join_transaction_mode="create_savepoint", expire_on_commit=False)
     user = User(
         username="admin",
         email="admin@test.com",
-        hashed_password=get_password_hash("admin123"),
+        hashed_password=_cached_hash("admin123"),
         full_name="Admin User",
         is_active=True,
         is_admin=True
     )
-    test_db.add(user)
-    test_db.commit()
-    test_db.refresh(user)
+    db.add(user)
+    db.commit()
+    db.close()
     return user
 
 # Authentication fixtures
-@pytest.fixture
-def auth_token(client, admin_user):
-    """Get authentication token for admin user"""
-    response = client.post(
-        "/api/auth/login",
-        data={"username": "admin", "password": "admin123"}
-    )
-    return response.json()["access_token"]
+@pytest.fixture(scope="session")
+def password_hasher():
+    """Hash a plaintext password, at most once per distinct password per session"""
+    return _cached_hash
 
-@pytest.fixture
+@pytest.fixture(scope="session")
+def hashed_password():
+    """Hash TEST_PASSWORD once per session"""
+    return _cached_hash(TEST_PASSWORD)
+
+@pytest.fixture(scope="session")
+def inactive_hashed_password():
+    """Hash INACTIVE_PASSWORD once per session"""
+    return _cached_hash(INACTIVE_PASSWORD)
+
+@functools.lru_cache(maxsize=8)
+def _token_for(username):
+    """Sign one JWT per username; long-lived so it outlasts the test session"""
+    return create_access_token({"sub": username}, expires_delta=timedelta(hours=12))
+
+@pytest.fixture(scope="session")
+def auth_token(admin_user):
+    """Mint an authentication token for the admin user"""
+    return _token_for(admin_user.username)
+
+@pytest.fixture(scope="session")
+def default_token():
+    """Sign a token for "testuser" with the default expiration"""
+    return create_access_token(data={"sub": "testuser"})
+
+@pytest.fixture(scope="session", params=[None, timedelta(minutes=15), timedelta(hours=1)], ids=["default", "15m", "1h"])
+def expiring_token(request):
+    """Sign a token for "testuser" per expiration (None: the default); returns (expires_delta, token)"""
+    return request.param, create_access_token(data={"sub": "testuser"}, expires_delta=request.param)
+
+@pytest.fixture(scope="session")
 def auth_headers(auth_token):
     """Get authorization headers with token"""
     return {"Authorization": f"Bearer {auth_token}"}
 
-# GitHub fixtures
 @pytest.fixture
-def github_user_data():
-    """Generate GitHub user test data"""
+def authed_client(client, auth_token):
+    """Test client that sends the admin's bearer token on every request"""
+    client.headers["Authorization"] = f"Bearer {auth_token}"
+    yield client
+    client.headers.pop("Authorization", None)
+
+# GitHub fixtures
+@pytest.fixture(scope="session")
+def _github_user_template():
+    """Generate GitHub user test data once per session"""
     return {
-        "username": fake.user_name(),
-        "github_id": fake.random_int(min=1000, max=999999),
-        "display_name": fake.name(),
-        "avatar_url": fake.image_url(),
-        "public_repos": fake.random_int(min=0, max=100),
+        "username": next(_usernames),
+        "github_id": next(_github_ids),
+        "display_name": next(_names),
+        "avatar_url": next(_image_urls),
+        "public_repos": next(_counts),
         "is_active": True
     }
 
+@pytest.fixture
+def github_user_data(_github_user_template):
+    """Generate GitHub user test data"""
+    return dict(_github_user_template)
+
 @pytest.fixture
 def test_github_user(test_db, test_user, github_user_data):
     """Create a test GitHub user"""
@@ -145,23 +364,26 @@ def test_github_user(test_db, test_user, github_user_data):
         is_active=github_user_data["is_active"],
         added_by_user_id=test_user.id
     )
-    test_db.add(github_user)
-    test_db.commit()
-    test_db.refresh(github_user)
+    _bulk_create(test_db, github_user)
     return github_user
 
-@pytest.fixture
-def github_org_data():
-    """Generate GitHub organization test data"""
+@pytest.fixture(scope="session")
+def _github_org_template():
+    """Generate GitHub organization test data once per session"""
     return {
-        "login": fake.company().lower().replace(" ", ""),
-        "github_id": fake.random_int(min=1000, max=999999),
-        "display_name": fake.company(),
-        "avatar_url": fake.image_url(),
-        "public_repos": fake.random_int(min=5, max=500),
-        "access_token": fake.sha256()[:40]
+        "login": next(_companies).lower().replace(" ", ""),
+        "github_id": next(_github_ids),
+        "display_name": next(_companies),
+        "avatar_url": next(_image_urls),
+        "public_repos": next(_counts),
+        "access_token": next(_tokens)
     }
 
+@pytest.fixture
+def github_org_data(_github_org_template):
+    """Generate GitHub organization test data"""
+    return dict(_github_org_template)
+
 @pytest.fixture
 def test_github_org(test_db, test_user, github_org_data):
     """Create a test GitHub organization"""
@@ -174,25 +396,28 @@ def test_github_org(test_db, test_user, github_org_data):
         access_token=github_org_data["access_token"],
         added_by_user_id=test_user.id
     )
-    test_db.add(github_org)
-    test_db.commit()
-    test_db.refresh(github_org)
+    _bulk_create(test_db, github_org)
     return github_org
 
 # Repository fixtures
-@pytest.fixture
-def repository_data():
-    """Generate repository test data"""
+@pytest.fixture(scope="session")
+def _repository_template():
+    """Generate repository test data once per session"""
     return {
-        "name": fake.slug(),
-        "full_name": f"{fake.user_name()}/{fake.slug()}",
-        "description": fake.sentence(),
-        "url": fake.url(),
-        "external_id": str(fake.random_int(min=1000, max=999999)),
+        "name": next(_slugs),
+        "full_name": f"{next(_usernames)}/{next(_slugs)}",
+        "description": next(_sentences),
+        "url": next(_urls),
+        "external_id": str(next(_github_ids)),
         "is_private": False,
         "provider": "github"
     }
 
+@pytest.fixture
+def repository_data(_repository_template):
+    """Generate repository test data"""
+    return dict(_repository_template)
+
 @pytest.fixture
 def test_repository(test_db, test_user, repository_data):
     """Create a test repository"""
@@ -207,13 +432,11 @@ def test_repository(test_db, test_user, repository_data):
         provider=RepositoryProvider.GITHUB,
         owner_id=test_user.id
     )
-    test_db.add(repository)
-    test_db.commit()
-    test_db.refresh(repository)
+    _bulk_create(test_db, repository)
     return repository
 
 # Mock fixtures for external services
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_github_api():
     """Mock GitHub API responses"""
     return {
@@ -239,20 +462,33 @@ def mock_github_api():
         ]
     }
 
+@pytest.fixture
+def mock_github_handler(monkeypatch):
+    """Route GitHubClient's httpx.AsyncClient through an arbitrary handler"""
+    def install(handler):
+        transport = httpx.MockTransport(handler)
+        real_client = httpx.AsyncClient
+        
+        def client_factory(*args, **kwargs):
+            kwargs["transport"] = transport
+            return real_client(*args, **kwargs)
+        
+        monkeypatch.setattr("app.repositories.github.httpx.AsyncClient", client_factory)
+    
+    return install
+
 # Test helper functions
 def create_test_user(db, **kwargs):
     """Helper function to create test users"""
     defaults = {
-        "username": fake.user_name(),
-        "email": fake.email(),
-        "hashed_password": get_password_hash("testpass"),
-        "full_name": fake.name(),
+        "username": next(_usernames),
+        "email": next(_emails),
+        "hashed_password": _cached_hash("testpass"),
+        "full_name": next(_names),
         "is_active": True
     }
     defaults.update(kwargs)
     
     user = User(**defaults)
-    db.add(user)
-    db.commit()
-    db.refresh(user)
+    _bulk_create(db, user)
     return user
\ No newline at end of file
@@ -1,7 +1,7 @@
 import pytest
 from fastapi import status
 from app.models.user import User
-from app.api.auth import get_password_hash
+from tests.conftest import INACTIVE_PASSWORD, skip_if_no_route
 
 class TestAuthEndpoints:
     """Test authentication API endpoints"""
@@ -63,28 +63,28 @@ class TestAuthEndpoints:
         response = client.post("/api/auth/login", data={})
         assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
     
-    def test_login_inactive_user(self, client, test_db, test_user_data):
+    def test_login_inactive_user(self, client, test_db, inactive_hashed_password):
         """Test login with inactive user"""
         # Create inactive user
         inactive_user = User(
             username="inactive_user",
             email="inactive@test.com",
-            hashed_password=get_password_hash("password123"),
+            hashed_password=inactive_hashed_password,
             is_active=False
         )
         test_db.add(inactive_user)
-        test_db.commit()
+        test_db.flush()
         
         response = client.post(
             "/api/auth/login",
-            data={"username": "inactive_user", "password": "password123"}
+            data={"username": "inactive_user", "password": INACTIVE_PASSWORD}
         )
         
         assert response.status_code == status.HTTP_401_UNAUTHORIZED
     
-    def test_get_current_user_success(self, client, auth_headers):
+    def test_get_current_user_success(self, authed_client):
         """Test getting current user info with valid token"""
-        response = client.get("/api/auth/me", headers=auth_headers)
+        response = authed_client.get("/api/auth/me")
         
         assert response.status_code == status.HTTP_200_OK
         data = response.json()
@@ -109,19 +109,18 @@ class TestAuthEndpoints:
         
         assert response.status_code == status.HTTP_401_UNAUTHORIZED
     
-    def test_get_current_user_malformed_auth_header(self, client):
+    @pytest.mark.parametrize("auth_header", [
+        "invalid_format",
+        "Bearer",  # Missing token
+        "NotBearer token123",
+        ""
+    ])
+    def test_get_current_user_malformed_auth_header(self, client, auth_header):
         """Test getting current user with malformed authorization header"""
-        malformed_headers = [
-            {"Authorization": "invalid_format"},
-            {"Authorization": "Bearer"},  # Missing token
-            {"Authorization": "NotBearer token123"},
-            {"Authorization": ""}
-        ]
-        
-        for headers in malformed_headers:
-            response = client.get("/api/auth/me", headers=headers)
-            assert response.status_code == status.HTTP_401_UNAUTHORIZED
+        response = client.get("/api/auth/me", headers={"Authorization": auth_header})
+        assert response.status_code == status.HTTP_401_UNAUTHORIZED
     
+    @skip_if_no_route("/api/auth/register", "POST")
     def test_register_user_success(self, client, test_db):
         """Test successful user registration"""
         user_data = {
@@ -133,10 +132,6 @@ class TestAuthEndpoints:
         
         response = client.post("/api/auth/register", json=user_data)
         
-        # Check if registration endpoint exists, otherwise skip
-        if response.status_code == status.HTTP_404_NOT_FOUND:
-            pytest.skip("Registration endpoint not implemented")
-        
         assert response.status_code == status.HTTP_201_CREATED
         data = response.json()
         
@@ -151,6 +146,7 @@ class TestAuthEndpoints:
         assert user is not None
         assert user.email == user_data["email"]
     
+    @skip_if_no_route("/api/auth/register", "POST")
     def test_register_duplicate_username(self, client, admin_user):
         """Test registration with duplicate username"""
         user_data = {
@@ -161,12 +157,9 @@ class TestAuthEndpoints:
         
         response = client.post("/api/auth/register", json=user_data)
         
-        # Skip if registration endpoint doesn't exist
-        if response.status_code == status.HTTP_404_NOT_FOUND:
-            pytest.skip("Registration endpoint not implemented")
-        
         assert response.status_code == status.HTTP_400_BAD_REQUEST
     
+    @skip_if_no_route("/api/auth/register", "POST")
     def test_register_duplicate_email(self, client, admin_user):
         """Test registration with duplicate email"""
         user_data = {
@@ -177,48 +170,37 @@ class TestAuthEndpoints:
         
         response = client.post("/api/auth/register", json=user_data)
         
-        # Skip if registration endpoint doesn't exist
-        if response.status_code == status.HTTP_404_NOT_FOUND:
-            pytest.skip("Registration endpoint not implemented")
-        
         assert response.status_code == status.HTTP_400_BAD_REQUEST
     
-    def test_register_invalid_data(self, client):
+    @skip_if_no_route("/api/auth/register", "POST")
+    @pytest.mark.parametrize("user_data", [
+        {"username": "", "email": "test@test.com", "password": "password"},  # Empty username
+        {"username": "test", "email": "invalid-email", "password": "password"},  # Invalid email
+        {"username": "test", "email": "test@test.com", "password": ""},  # Empty password
+        {"username": "test", "email": "test@test.com"},  # Missing password
+        {"email": "test@test.com", "password": "password"},  # Missing username
+        {"username": "test", "password": "password"},  # Missing email
+    ])
+    def test_register_invalid_data(self, client, user_data):
         """Test registration with invalid data"""
-        invalid_data_sets = [
-            {"username": "", "email": "test@test.com", "password": "password"},  # Empty username
-            {"username": "test", "email": "invalid-email", "password": "password"},  # Invalid email
-            {"username": "test", "email": "test@test.com", "password": ""},  # Empty password
-            {"username": "test", "email": "test@test.com"},  # Missing password
-            {"email": "test@test.com", "password": "password"},  # Missing username
-            {"username": "test", "password": "password"},  # Missing email
-        ]
+        response = client.post("/api/auth/register", json=user_data)
         
-        for user_data in invalid_data_sets:
-            response = client.post("/api/auth/register", json=user_data)
-            
-            # Skip if registration endpoint doesn't exist
-            if response.status_code == status.HTTP_404_NOT_FOUND:
-                pytest.skip("Registration endpoint not implemented")
-            
-            assert response.status_code in [status.HTTP_400_BAD_REQUEST, status.HTTP_422_UNPROCESSABLE_ENTITY]
+        assert response.status_code in [status.HTTP_400_BAD_REQUEST, status.HTTP_422_UNPROCESSABLE_ENTITY]
 
 class TestProtectedEndpoints:
     """Test that endpoints requiring authentication are properly protected"""
     
-    def test_protected_endpoint_without_auth(self, client):
+    # These are examples of endpoints that should require authentication
+    @pytest.mark.parametrize("endpoint", [
+        "/api/repositories",
+        "/api/github/users",
+        "/api/analytics/effort"
+    ])
+    def test_protected_endpoint_without_auth(self, client, endpoint):
         """Test accessing protected endpoints without authentication"""
-        # These are examples of endpoints that should require authentication
-        protected_endpoints = [
-            "/api/repositories",
-            "/api/github/users",
-            "/api/analytics/effort"
-        ]
-        
-        for endpoint in protected_endpoints:
-            response = client.get(endpoint)
-            # Should return 401 Unauthorized for protected endpoints
-            assert response.status_code == status.HTTP_401_UNAUTHORIZED
+        response = client.get(endpoint)
+        # Should return 401 Unauthorized for protected endpoints
+        assert response.status_code == status.HTTP_401_UNAUTHORIZED
     
     def test_protected_endpoint_with_invalid_auth(self, client):
         """Test accessing protected endpoints with invalid authentication"""
@@ -233,10 +215,10 @@ class TestProtectedEndpoints:
             response = client.get(endpoint, headers=headers)
             assert response.status_code == status.HTTP_401_UNAUTHORIZED
     
-    def test_protected_endpoint_with_valid_auth(self, client, auth_headers):
+    def test_protected_endpoint_with_valid_auth(self, authed_client):
         """Test accessing protected endpoints with valid authentication"""
         # Test that we can access protected endpoints with valid auth
-        response = client.get("/api/repositories", headers=auth_headers)
+        response = authed_client.get("/api/repositories")
         
         # Should not return 401 (might return 200, 404, or other valid status)
         assert response.status_code != status.HTTP_401_UNAUTHORIZED
\ No newline at end of file
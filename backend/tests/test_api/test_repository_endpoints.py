@@ -1,22 +1,23 @@
 import pytest
 from fastapi import status
-from app.models.repository import Repository
+from app.models.repository import Repository, RepositoryProvider
+from tests.conftest import skip_if_no_route
 
 class TestRepositoryEndpoints:
     """Test repository management API endpoints"""
     
-    def test_get_repositories_empty(self, client, auth_headers):
+    def test_get_repositories_empty(self, authed_client, fresh_db):
         """Test getting repositories when none exist"""
-        response = client.get("/api/repositories", headers=auth_headers)
+        response = authed_client.get("/api/repositories")
         
         assert response.status_code == status.HTTP_200_OK
         data = response.json()
         assert isinstance(data, list)
         assert len(data) == 0
     
-    def test_get_repositories_with_data(self, client, auth_headers, test_repository):
+    def test_get_repositories_with_data(self, authed_client, test_repository):
         """Test getting repositories when some exist"""
-        response = client.get("/api/repositories", headers=auth_headers)
+        response = authed_client.get("/api/repositories")
         
         assert response.status_code == status.HTTP_200_OK
         data = response.json()
@@ -30,14 +31,14 @@ class TestRepositoryEndpoints:
         assert "url" in repo
         assert "provider" in repo
     
-    def test_add_repository_success(self, client, auth_headers, test_db):
+    def test_add_repository_success(self, authed_client, test_db):
         """Test adding a new repository"""
         repo_data = {
             "url": "https://github.com/testuser/test-repo",
             "provider": "github"
         }
         
-        response = client.post("/api/repositories", json=repo_data, headers=auth_headers)
+        response = authed_client.post("/api/repositories", json=repo_data)
         
         assert response.status_code == status.HTTP_201_CREATED
         data = response.json()
@@ -51,38 +52,34 @@ class TestRepositoryEndpoints:
         assert repo is not None
         assert repo.provider == repo_data["provider"]
     
-    def test_add_repository_invalid_url(self, client, auth_headers):
+    @pytest.mark.parametrize("repo_data", [
+        {"url": "not-a-url", "provider": "github"},
+        {"url": "", "provider": "github"},
+        {"url": "ftp://invalid-protocol.com/repo", "provider": "github"}
+    ])
+    def test_add_repository_invalid_url(self, authed_client, repo_data):
         """Test adding repository with invalid URL"""
-        invalid_data_sets = [
-            {"url": "not-a-url", "provider": "github"},
-            {"url": "", "provider": "github"},
-            {"url": "ftp://invalid-protocol.com/repo", "provider": "github"}
-        ]
-        
-        for repo_data in invalid_data_sets:
-            response = client.post("/api/repositories", json=repo_data, headers=auth_headers)
-            assert response.status_code in [status.HTTP_400_BAD_REQUEST, status.HTTP_422_UNPROCESSABLE_ENTITY]
+        response = authed_client.post("/api/repositories", json=repo_data)
+        assert response.status_code in [status.HTTP_400_BAD_REQUEST, status.HTTP_422_UNPROCESSABLE_ENTITY]
     
-    def test_add_repository_missing_data(self, client, auth_headers):
+    @pytest.mark.parametrize("repo_data", [
+        {"provider": "github"},  # Missing URL
+        {"url": "https://github.com/user/repo"},  # Missing provider
+        {}  # Missing both
+    ])
+    def test_add_repository_missing_data(self, authed_client, repo_data):
         """Test adding repository with missing required data"""
-        invalid_data_sets = [
-            {"provider": "github"},  # Missing URL
-            {"url": "https://github.com/user/repo"},  # Missing provider
-            {}  # Missing both
-        ]
-        
-        for repo_data in invalid_data_sets:
-            response = client.post("/api/repositories", json=repo_data, headers=auth_headers)
-            assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+        response = authed_client.post("/api/repositories", json=repo_data)
+        assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
     
-    def test_add_duplicate_repository(self, client, auth_headers, test_repository):
+    def test_add_duplicate_repository(self, authed_client, test_repository):
         """Test adding duplicate repository"""
         repo_data = {
             "url": test_repository.url,
             "provider": test_repository.provider
         }
         
-        response = client.post("/api/repositories", json=repo_data, headers=auth_headers)
+        response = authed_client.post("/api/repositories", json=repo_data)
         
         # Should handle duplicates appropriately (either error or ignore)
         assert response.status_code in [
@@ -91,11 +88,11 @@ class TestRepositoryEndpoints:
             status.HTTP_409_CONFLICT      # Conflict status
         ]
     
-    def test_delete_repository_success(self, client, auth_headers, test_repository, test_db):
+    def test_delete_repository_success(self, authed_client, test_repository, test_db):
         """Test deleting a repository"""
         repo_id = test_repository.id
         
-        response = client.delete(f"/api/repositories/{repo_id}", headers=auth_headers)
+        response = authed_client.delete(f"/api/repositories/{repo_id}")
         
         assert response.status_code == status.HTTP_200_OK
         
@@ -103,19 +100,19 @@ class TestRepositoryEndpoints:
         deleted_repo = test_db.query(Repository).filter(Repository.id == repo_id).first()
         assert deleted_repo is None
     
-    def test_delete_nonexistent_repository(self, client, auth_headers):
+    def test_delete_nonexistent_repository(self, authed_client):
         """Test deleting non-existent repository"""
         nonexistent_id = 99999
         
-        response = client.delete(f"/api/repositories/{nonexistent_id}", headers=auth_headers)
+        response = authed_client.delete(f"/api/repositories/{nonexistent_id}")
         
         assert response.status_code == status.HTTP_404_NOT_FOUND
     
-    def test_sync_repository_success(self, client, auth_headers, test_repository):
+    def test_sync_repository_success(self, authed_client, test_repository):
         """Test triggering repository sync"""
         repo_id = test_repository.id
         
-        response = client.post(f"/api/repositories/{repo_id}/sync", headers=auth_headers)
+        response = authed_client.post(f"/api/repositories/{repo_id}/sync")
         
         # Should accept sync request (actual sync happens in background)
         assert response.status_code in [status.HTTP_200_OK, status.HTTP_202_ACCEPTED]
@@ -123,22 +120,20 @@ class TestRepositoryEndpoints:
         data = response.json()
         assert "message" in data or "task_id" in data
     
-    def test_sync_nonexistent_repository(self, client, auth_headers):
+    def test_sync_nonexistent_repository(self, authed_client):
         """Test syncing non-existent repository"""
         nonexistent_id = 99999
         
-        response = client.post(f"/api/repositories/{nonexistent_id}/sync", headers=auth_headers)
+        response = authed_client.post(f"/api/repositories/{nonexistent_id}/sync")
         
         assert response.status_code == status.HTTP_404_NOT_FOUND
     
-    def test_get_repository_details(self, client, auth_headers, test_repository):
+    @skip_if_no_route("/api/repositories/{repo_id}", "GET")
+    def test_get_repository_details(self, authed_client, test_repository):
         """Test getting individual repository details"""
         repo_id = test_repository.id
         
-        response = client.get(f"/api/repositories/{repo_id}", headers=auth_headers)
-        
-        if response.status_code == status.HTTP_404_NOT_FOUND:
-            pytest.skip("Individual repository endpoint not implemented")
+        response = authed_client.get(f"/api/repositories/{repo_id}")
         
         assert response.status_code == status.HTTP_200_OK
         data = response.json()
@@ -147,41 +142,43 @@ class TestRepositoryEndpoints:
         assert data["name"] == test_repository.name
         assert data["url"] == test_repository.url
     
-    def test_unauthorized_access(self, client):
+    @pytest.mark.parametrize("method,endpoint", [
+        ("GET", "/api/repositories"),
+        ("POST", "/api/repositories"),
+        ("DELETE", "/api/repositories/1"),
+        ("POST", "/api/repositories/1/sync")
+    ])
+    def test_unauthorized_access(self, client, method, endpoint):
         """Test repository endpoints without authentication"""
-        endpoints = [
-            ("GET", "/api/repositories"),
-            ("POST", "/api/repositories"),
-            ("DELETE", "/api/repositories/1"),
-            ("POST", "/api/repositories/1/sync")
-        ]
-        
-        for method, endpoint in endpoints:
-            if method == "GET":
-                response = client.get(endpoint)
-            elif method == "POST":
-                response = client.post(endpoint, json={})
-            elif method == "DELETE":
-                response = client.delete(endpoint)
-            
-            assert response.status_code == status.HTTP_401_UNAUTHORIZED
+        if method == "GET":
+            response = client.get(endpoint)
+        elif method == "POST":
+            response = client.post(endpoint, json={})
+        elif method == "DELETE":
+            response = client.delete(endpoint)
+        
+        assert response.status_code == status.HTTP_401_UNAUTHORIZED
     
-    def test_repository_filtering_by_provider(self, client, auth_headers, test_db, test_user):
+    def test_repository_filtering_by_provider(self, authed_client, test_db, test_user):
         """Test filtering repositories by provider"""
         # Create repositories with different providers
         providers = ["github", "gitlab", "bitbucket"]
-        for provider in providers:
-            repo = Repository(
-                name=f"test-repo-{provider}",
-                url=f"https://{provider}.com/user/test-repo-{provider}",
-                provider=provider,
-                owner_id=test_user.id
-            )
-            test_db.add(repo)
-        test_db.commit()
+        test_db.execute(
+            Repository.__table__.insert(),
+            [
+                {
+                    "name": f"test-repo-{provider}",
+                    "full_name": f"user/test-repo-{provider}",
+                    "url": f"https://{provider}.com/user/test-repo-{provider}",
+                    "provider": RepositoryProvider(provider),
+                    "owner_id": test_user.id
+                }
+                for provider in providers
+            ]
+        )
         
         # Test filtering (if supported)
-        response = client.get("/api/repositories?provider=github", headers=auth_headers)
+        response = authed_client.get("/api/repositories?provider=github")
         
         if response.status_code == status.HTTP_200_OK:
             data = response.json()
@@ -190,20 +187,25 @@ class TestRepositoryEndpoints:
                 if "provider" in repo:
                     assert repo["provider"] == "github"
     
-    def test_repository_pagination(self, client, auth_headers, test_db, test_user):
+    def test_repository_pagination(self, authed_client, test_db, test_user):
         """Test repository list pagination"""
         # Create multiple repositories
-        for i in range(15):
-            repo = Repository(
-                name=f"test-repo-{i}",
-                url=f"https://github.com/user/test-repo-{i}",
-                owner_id=test_user.id
-            )
-            test_db.add(repo)
-        test_db.commit()
+        test_db.execute(
+            Repository.__table__.insert(),
+            [
+                {
+                    "name": f"test-repo-{i}",
+                    "full_name": f"user/test-repo-{i}",
+                    "url": f"https://github.com/user/test-repo-{i}",
+                    "provider": RepositoryProvider.GITHUB,
+                    "owner_id": test_user.id
+                }
+                for i in range(15)
+            ]
+        )
         
         # Test pagination parameters (if supported)
-        response = client.get("/api/repositories?limit=10&offset=0", headers=auth_headers)
+        response = authed_client.get("/api/repositories?limit=10&offset=0")
         
         if response.status_code == status.HTTP_200_OK:
             data = response.json()
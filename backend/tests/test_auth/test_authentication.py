@@ -9,12 +9,13 @@ from app.api.auth import (
     get_current_user,
     authenticate_user
 )
-from app.config import settings
 from app.models.user import User
+from tests.conftest import PYTEST_FAST, TEST_PASSWORD
 
 class TestPasswordUtils:
     """Test password hashing and verification utilities"""
     
+    @pytest.mark.real_bcrypt
     def test_password_hashing(self):
         """Test password hashing"""
         password = "test_password_123"
@@ -24,87 +25,67 @@ class TestPasswordUtils:
         assert len(hashed) > 50  # bcrypt hashes are typically 60 characters
         assert hashed.startswith("$2b$")  # bcrypt prefix
     
-    def test_password_verification(self):
+    def test_password_verification(self, hashed_password):
         """Test password verification"""
-        password = "test_password_123"
-        hashed = get_password_hash(password)
-        
         # Correct password should verify
-        assert verify_password(password, hashed) is True
+        assert verify_password(TEST_PASSWORD, hashed_password) is True
         
         # Wrong password should not verify
-        assert verify_password("wrong_password", hashed) is False
-        assert verify_password("", hashed) is False
+        assert verify_password("wrong_password", hashed_password) is False
+        assert verify_password("", hashed_password) is False
+        
+        # PYTEST_FAST stores passwords with the plaintext scheme
+        if not PYTEST_FAST:
+            assert hashed_password.startswith("$2b$")  # bcrypt prefix
     
+    @pytest.mark.real_bcrypt
     def test_different_passwords_different_hashes(self):
         """Test that same password produces different hashes (salt)"""
-        password = "same_password"
-        hash1 = get_password_hash(password)
-        hash2 = get_password_hash(password)
+        # Both hashes come from this test so they use bcrypt even under PYTEST_FAST
+        hash1 = get_password_hash(TEST_PASSWORD)
+        hash2 = get_password_hash(TEST_PASSWORD)
         
         # Hashes should be different due to salt
         assert hash1 != hash2
         
         # But both should verify the same password
-        assert verify_password(password, hash1) is True
-        assert verify_password(password, hash2) is True
+        assert verify_password(TEST_PASSWORD, hash1) is True
+        assert verify_password(TEST_PASSWORD, hash2) is True
 
 class TestJWTTokens:
     """Test JWT token creation and validation"""
     
-    def test_create_access_token(self):
+    def test_create_access_token(self, default_token):
         """Test creating access token"""
-        username = "testuser"
-        token = create_access_token(data={"sub": username})
-        
-        assert token is not None
-        assert isinstance(token, str)
-        assert len(token) > 50  # JWT tokens are fairly long
+        assert default_token is not None
+        assert isinstance(default_token, str)
+        assert len(default_token) > 50  # JWT tokens are fairly long
     
-    def test_token_contains_correct_data(self):
+    def test_token_contains_correct_data(self, default_token):
         """Test that token contains correct user data"""
-        username = "testuser"
-        token = create_access_token(data={"sub": username})
-        
         # Decode token (without verification for testing)
-        payload = jwt.decode(token, settings.secret_key, algorithms=[settings.algorithm])
+        payload = jwt.get_unverified_claims(default_token)
         
-        assert payload["sub"] == username
+        assert payload["sub"] == "testuser"
         assert "exp" in payload  # Expiration should be set
     
-    def test_token_expiration(self):
-        """Test token expiration time"""
-        username = "testuser"
-        expires_delta = timedelta(minutes=15)
-        token = create_access_token(data={"sub": username}, expires_delta=expires_delta)
+    def test_token_expiration(self, expiring_token):
+        """Test token expiration time, for the default and explicit expirations"""
+        expires_delta, token = expiring_token
+        if expires_delta is None:
+            # create_access_token's own fallback; login passes access_token_expire_minutes explicitly
+            expires_delta = timedelta(minutes=15)
         
-        payload = jwt.decode(token, settings.secret_key, algorithms=[settings.algorithm])
+        payload = jwt.get_unverified_claims(token)
         exp_timestamp = payload["exp"]
         exp_datetime = datetime.fromtimestamp(exp_timestamp)
         
-        # Should expire in approximately 15 minutes
+        # Should expire in approximately expires_delta
         expected_exp = datetime.utcnow() + expires_delta
         time_diff = abs((exp_datetime - expected_exp).total_seconds())
         
         # Allow 5 seconds tolerance for test execution time
         assert time_diff < 5
-    
-    def test_token_with_custom_expiration(self):
-        """Test token with custom expiration"""
-        username = "testuser"
-        custom_expires = timedelta(hours=1)
-        token = create_access_token(data={"sub": username}, expires_delta=custom_expires)
-        
-        payload = jwt.decode(token, settings.secret_key, algorithms=[settings.algorithm])
-        exp_timestamp = payload["exp"]
-        exp_datetime = datetime.fromtimestamp(exp_timestamp)
-        
-        # Should expire in approximately 1 hour
-        expected_exp = datetime.utcnow() + custom_expires
-        time_diff = abs((exp_datetime - expected_exp).total_seconds())
-        
-        # Allow 5 seconds tolerance
-        assert time_diff < 5
 
 class TestUserAuthentication:
     """Test user authentication functions"""
@@ -129,13 +110,13 @@ class TestUserAuthentication:
         
         assert user is False
     
-    def test_authenticate_inactive_user(self, test_db, test_user_data):
+    def test_authenticate_inactive_user(self, test_db, test_user_data, hashed_password):
         """Test authentication with inactive user"""
         # Create inactive user
         inactive_user = User(
             username=test_user_data["username"] + "_inactive",
             email="inactive@test.com",
-            hashed_password=get_password_hash(test_user_data["password"]),
+            hashed_password=hashed_password,
             is_active=False
         )
         test_db.add(inactive_user)
@@ -193,13 +174,13 @@ class TestGetCurrentUser:
         
         assert exc_info.value.status_code == status.HTTP_401_UNAUTHORIZED
     
-    def test_get_current_user_inactive_user(self, test_db, test_user_data):
+    def test_get_current_user_inactive_user(self, test_db, test_user_data, hashed_password):
         """Test getting current user for inactive user"""
         # Create inactive user
         inactive_user = User(
             username=test_user_data["username"] + "_inactive",
             email="inactive@test.com",
-            hashed_password=get_password_hash(test_user_data["password"]),
+            hashed_password=hashed_password,
             is_active=False
         )
         test_db.add(inactive_user)
@@ -213,17 +194,15 @@ class TestGetCurrentUser:
         
         assert exc_info.value.status_code == status.HTTP_401_UNAUTHORIZED
     
-    def test_get_current_user_malformed_token(self, test_db):
+    @pytest.mark.parametrize("bad_token", [
+        "",
+        "not.a.token",
+        "eyJ0eXAiOiJKV1QiLCJhbGciOiJIUzI1NiJ9",  # Incomplete token
+        "bearer_token_without_bearer_prefix"
+    ])
+    def test_get_current_user_malformed_token(self, test_db, bad_token):
         """Test getting current user with malformed token"""
-        malformed_tokens = [
-            "",
-            "not.a.token",
-            "eyJ0eXAiOiJKV1QiLCJhbGciOiJIUzI1NiJ9",  # Incomplete token
-            "bearer_token_without_bearer_prefix"
-        ]
-        
-        for token in malformed_tokens:
-            with pytest.raises(HTTPException) as exc_info:
-                get_current_user(token=token, db=test_db)
-            
-            assert exc_info.value.status_code == status.HTTP_401_UNAUTHORIZED
\ No newline at end of file
+        with pytest.raises(HTTPException) as exc_info:
+            get_current_user(token=bad_token, db=test_db)
+        
+        assert exc_info.value.status_code == status.HTTP_401_UNAUTHORIZED
\ No newline at end of file
@@ -0,0 +1,55 @@
+import dataclasses
+import pytest
+from datetime import datetime, timezone
+
+from app.repositories.github import ParsedCommit, parse_commit_data
+
+
+@pytest.fixture
+def github_commit_payload():
+    """A trimmed GitHub commit detail response"""
+    return {
+        "sha": "a" * 40,
+        "commit": {
+            "message": "Fix parser",
+            "author": {"name": "Ada", "email": "ada@test.com", "date": "2024-01-02T03:04:05Z"},
+            "committer": {"name": "Bob", "email": "bob@test.com"},
+        },
+        "parents": [{"sha": "b" * 40}, {"sha": "c" * 40}],
+        "files": [
+            {"filename": "new.py", "status": "added", "additions": 10, "deletions": 0},
+            {"filename": "old.py", "status": "removed", "additions": 0, "deletions": 4},
+            {"filename": "main.py", "status": "modified", "additions": 2, "deletions": 1},
+        ],
+    }
+
+
+class TestParseCommitData:
+    """Test cases for parse_commit_data"""
+    
+    def test_parses_commit_fields(self, github_commit_payload):
+        """Test that metadata and file statistics are extracted"""
+        parsed = parse_commit_data(github_commit_payload)
+        
+        assert isinstance(parsed, ParsedCommit)
+        assert parsed.sha == "a" * 40
+        assert parsed.message == "Fix parser"
+        assert parsed.author_name == "Ada"
+        assert parsed.committer_email == "bob@test.com"
+        assert parsed.commit_date == datetime(2024, 1, 2, 3, 4, 5, tzinfo=timezone.utc)
+        assert parsed.lines_added == 12
+        assert parsed.lines_removed == 5
+        assert parsed.files_changed == 3
+        assert parsed.files_added == ["new.py"]
+        assert parsed.files_deleted == ["old.py"]
+        assert parsed.files_modified == ["main.py"]
+        assert parsed.parent_shas == ["b" * 40, "c" * 40]
+        assert parsed.is_merge is True
+    
+    def test_parsed_commit_is_immutable(self, github_commit_payload):
+        """Test that ParsedCommit is a frozen, slotted record"""
+        parsed = parse_commit_data(github_commit_payload)
+        
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            parsed.sha = "other"
+        assert not hasattr(parsed, "__dict__")
@@ -0,0 +1,163 @@
+import httpx
+import pytest
+
+from app.repositories.github import GitHubClient
+
+
+def _paged_handler(pages):
+    """Build a handler serving the given pages by ?page= number"""
+    requested = []
+    
+    def handler(request: httpx.Request) -> httpx.Response:
+        page = int(request.url.params["page"])
+        requested.append(page)
+        body = pages[page - 1] if page <= len(pages) else []
+        return httpx.Response(200, json=body)
+    
+    return handler, requested
+
+
+@pytest.fixture
+def mock_github_transport(mock_github_handler):
+    """Serve paginated responses and return the list of requested page numbers"""
+    def install(pages):
+        handler, requested = _paged_handler(pages)
+        mock_github_handler(handler)
+        return requested
+    
+    return install
+
+
+class TestGitHubClientHeaders:
+    """Test default request headers"""
+    
+    def test_headers_prebuilt(self):
+        """Test that headers are an httpx.Headers with the current media type"""
+        client = GitHubClient()
+        
+        assert isinstance(client.headers, httpx.Headers)
+        assert client.headers["Accept"] == "application/vnd.github+json"
+        assert "Authorization" not in client.headers
+    
+    def test_headers_include_token(self):
+        """Test that an access token is sent as an Authorization header"""
+        client = GitHubClient("secret-token")
+        
+        assert client.headers["Authorization"] == "token secret-token"
+
+
+class TestGitHubClientPagination:
+    """Test paginated GitHub list endpoints"""
+    
+    @pytest.mark.asyncio
+    async def test_iter_commits_yields_pages(self, mock_github_transport):
+        """Test that iter_commits yields one list per page"""
+        pages = [
+            [{"sha": "a"}, {"sha": "b"}],
+            [{"sha": "c"}],
+        ]
+        requested = mock_github_transport(pages)
+        client = GitHubClient()
+        
+        received = [page async for page in client.iter_commits("owner", "repo")]
+        
+        assert received == pages
+        assert requested == [1, 2, 3]
+    
+    @pytest.mark.asyncio
+    async def test_get_commits_flattens_pages(self, mock_github_transport):
+        """Test that get_commits still returns a flat list"""
+        mock_github_transport([[{"sha": "a"}, {"sha": "b"}], [{"sha": "c"}]])
+        client = GitHubClient()
+        
+        commits = await client.get_commits("owner", "repo")
+        
+        assert [c["sha"] for c in commits] == ["a", "b", "c"]
+    
+    @pytest.mark.asyncio
+    async def test_iter_commits_stops_at_known_sha(self, mock_github_transport):
+        """Test that pagination stops at the first page ending in a known commit"""
+        pages = [
+            [{"sha": "new1"}, {"sha": "new2"}],
+            [{"sha": "new3"}, {"sha": "old1"}],
+            [{"sha": "old2"}],
+        ]
+        requested = mock_github_transport(pages)
+        client = GitHubClient()
+        
+        commits = await client.get_commits("owner", "repo", known_shas={"old1", "old2"})
+        
+        assert [c["sha"] for c in commits] == ["new1", "new2", "new3"]
+        assert requested == [1, 2]
+    
+    @pytest.mark.asyncio
+    async def test_pagination_stops_at_limit(self, mock_github_transport):
+        """Test that pagination stops once 1000 items have been fetched"""
+        pages = [[{"id": i} for i in range(100)] for _ in range(12)]
+        requested = mock_github_transport(pages)
+        client = GitHubClient()
+        
+        repos = await client.get_user_repositories("someone")
+        
+        assert len(repos) == 1000
+        assert requested == list(range(1, 11))
+
+
+@pytest.fixture
+def no_sleep(monkeypatch):
+    """Record rate-limit back-off delays instead of sleeping"""
+    delays = []
+    
+    async def fake_sleep(delay):
+        delays.append(delay)
+    
+    monkeypatch.setattr("app.repositories.github.asyncio.sleep", fake_sleep)
+    return delays
+
+
+class TestGitHubClientCommitDetails:
+    """Test concurrent commit detail fetching"""
+    
+    @pytest.mark.asyncio
+    async def test_get_commit_details_many_preserves_order(self, mock_github_handler):
+        """Test that results come back in the order the SHAs were given"""
+        mock_github_handler(
+            lambda request: httpx.Response(200, json={"sha": request.url.path.rsplit("/", 1)[-1]})
+        )
+        client = GitHubClient()
+        shas = [f"sha{i}" for i in range(25)]
+        
+        details = await client.get_commit_details_many("owner", "repo", shas)
+        
+        assert [d["sha"] for d in details] == shas
+    
+    @pytest.mark.asyncio
+    async def test_retries_after_secondary_rate_limit(self, mock_github_handler, no_sleep):
+        """Test that a 429 with Retry-After is retried after the advertised delay"""
+        calls = []
+        
+        def handler(request):
+            calls.append(request)
+            if len(calls) == 1:
+                return httpx.Response(429, headers={"Retry-After": "7"})
+            return httpx.Response(200, json={"sha": "abc"})
+        
+        mock_github_handler(handler)
+        client = GitHubClient()
+        
+        details = await client.get_commit_details("owner", "repo", "abc")
+        
+        assert details == {"sha": "abc"}
+        assert len(calls) == 2
+        assert no_sleep == [7.0]
+    
+    @pytest.mark.asyncio
+    async def test_plain_forbidden_is_not_retried(self, mock_github_handler, no_sleep):
+        """Test that a 403 without rate limit headers raises immediately"""
+        mock_github_handler(lambda request: httpx.Response(403, json={"message": "Forbidden"}))
+        client = GitHubClient()
+        
+        with pytest.raises(httpx.HTTPStatusError):
+            await client.get_commit_details("owner", "repo", "abc")
+        
+        assert no_sleep == []
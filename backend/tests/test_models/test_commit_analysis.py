@@ -0,0 +1,59 @@
+import pytest
+from datetime import datetime
+from app.models.analysis import CommitAnalysis, CommitType, ComplexityLevel
+from app.models.commit import Commit
+
+@pytest.fixture
+def test_commit(test_db, test_repository):
+    """Create a test commit"""
+    commit = Commit(
+        sha="a" * 40,
+        message="Add feature",
+        author_name="Test Author",
+        author_email="author@test.com",
+        commit_date=datetime(2024, 5, 1, 12, 0, 0),
+        repository_id=test_repository.id
+    )
+    test_db.add(commit)
+    test_db.commit()
+    test_db.refresh(commit)
+    return commit
+
+class TestCommitAnalysisModel:
+    """Test cases for CommitAnalysis model"""
+    
+    def test_denormalized_fields_copied_from_commit(self, test_db, test_commit):
+        """Test that repository_id and commit_date are filled from the commit"""
+        analysis = CommitAnalysis(
+            commit=test_commit,
+            commit_type=CommitType.FEATURE,
+            complexity_level=ComplexityLevel.LOW,
+            effort_score=10.0
+        )
+        
+        test_db.add(analysis)
+        test_db.commit()
+        test_db.refresh(analysis)
+        
+        assert analysis.repository_id == test_commit.repository_id
+        assert analysis.commit_date.replace(tzinfo=None) == test_commit.commit_date.replace(tzinfo=None)
+    
+    def test_denormalized_fields_loaded_by_commit_id(self, test_db, test_commit):
+        """Test that the fields are looked up when only commit_id is given"""
+        commit_id = test_commit.id
+        repository_id = test_commit.repository_id
+        test_db.expunge(test_commit)
+        
+        analysis = CommitAnalysis(
+            commit_id=commit_id,
+            commit_type=CommitType.BUGFIX,
+            complexity_level=ComplexityLevel.MEDIUM,
+            effort_score=25.0
+        )
+        
+        test_db.add(analysis)
+        test_db.commit()
+        test_db.refresh(analysis)
+        
+        assert analysis.repository_id == repository_id
+        assert analysis.commit_date is not None
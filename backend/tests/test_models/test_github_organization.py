@@ -0,0 +1,55 @@
+import pytest
+from sqlalchemy import inspect
+from app.models.github_organization import GitHubOrganization
+from app.models.github_organization_secrets import GitHubOrganizationSecrets
+
+class TestGitHubOrganizationModel:
+    """Test cases for GitHubOrganization model"""
+    
+    def test_access_token_stored_in_secrets_table(self, test_db, test_github_org, github_org_data):
+        """Test that OAuth credentials are persisted in the side table"""
+        secrets = test_db.query(GitHubOrganizationSecrets).filter(
+            GitHubOrganizationSecrets.organization_id == test_github_org.id
+        ).one()
+        
+        assert secrets.access_token == github_org_data["access_token"]
+        assert test_github_org.access_token == github_org_data["access_token"]
+    
+    def test_secrets_not_loaded_with_organization(self, test_db, test_github_org, github_org_data):
+        """Test that loading an organization does not fetch its credentials"""
+        org_id = test_github_org.id
+        test_db.expunge_all()
+        
+        github_org = test_db.query(GitHubOrganization).filter(GitHubOrganization.id == org_id).one()
+        
+        assert "secrets" in inspect(github_org).unloaded
+        assert github_org.access_token == github_org_data["access_token"]
+    
+    def test_organization_without_token(self, test_db, test_user):
+        """Test that an organization without credentials reads them as None"""
+        github_org = GitHubOrganization(
+            login="notoken",
+            github_id=424242,
+            added_by_user_id=test_user.id
+        )
+        
+        test_db.add(github_org)
+        test_db.commit()
+        test_db.refresh(github_org)
+        
+        assert github_org.secrets is None
+        assert github_org.access_token is None
+        assert github_org.scopes is None
+    
+    def test_update_token_on_existing_secrets(self, test_db, test_github_org):
+        """Test that updating a token reuses the existing secrets row"""
+        test_github_org.access_token = "new-token"
+        test_github_org.scopes = "repo,read:org"
+        test_db.commit()
+        
+        rows = test_db.query(GitHubOrganizationSecrets).filter(
+            GitHubOrganizationSecrets.organization_id == test_github_org.id
+        ).all()
+        assert len(rows) == 1
+        assert rows[0].access_token == "new-token"
+        assert rows[0].scopes == "repo,read:org"
@@ -1,9 +1,24 @@
 import pytest
 from datetime import datetime
+from sqlalchemy import insert, text
 from sqlalchemy.exc import IntegrityError
-from app.models.repository import Repository
+from app.models.repository import Repository, RepositoryProvider
 from app.models.user import User
 
+@pytest.fixture(scope="module")
+def default_repository(test_db_module, module_user):
+    """Repository created once per module with only the required fields set"""
+    repository = Repository(
+        name="test-repo",
+        full_name="user/test-repo",
+        url="https://github.com/user/test-repo",
+        provider=RepositoryProvider.GITHUB,
+        owner_id=module_user.id
+    )
+    test_db_module.add(repository)
+    test_db_module.commit()
+    return repository
+
 class TestRepositoryModel:
     """Test cases for Repository model"""
     
@@ -23,7 +38,7 @@ class TestRepositoryModel:
         
         test_db.add(repository)
         test_db.commit()
-        test_db.refresh(repository)
+        test_db.refresh(repository, attribute_names=["created_at"])
         
         assert repository.id is not None
         assert repository.name == repository_data["name"]
@@ -36,28 +51,37 @@ class TestRepositoryModel:
         assert repository.owner_id == test_user.id
         assert repository.created_at is not None
     
-    def test_repository_defaults(self, test_db, test_user):
+    @pytest.mark.parametrize("attr,expected", [
+        ("description", None),
+        ("default_branch", "main"),
+        ("is_private", False),
+        ("provider", RepositoryProvider.GITHUB),
+        ("is_active", True),
+        ("last_synced_at", None),
+        ("sync_status", "pending"),
+    ])
+    def test_repository_defaults(self, default_repository, attr, expected):
         """Test default values for repository fields"""
-        from app.models.repository import RepositoryProvider
-        repository = Repository(
-            name="test-repo",
-            full_name="user/test-repo",
-            url="https://github.com/user/test-repo",
-            provider=RepositoryProvider.GITHUB,
-            owner_id=test_user.id
+        value = getattr(default_repository, attr)
+        
+        assert value == expected
+        assert type(value) is type(expected)
+    
+    def test_repository_server_defaults(self, test_db, test_user):
+        """Test that flag columns are filled by the database when omitted from an INSERT"""
+        # Raw SQL so SQLAlchemy's Python-side defaults are not applied
+        test_db.execute(
+            text(
+                "INSERT INTO repositories (name, full_name, url, provider, owner_id) "
+                "VALUES ('core-insert', 'user/core-insert', 'https://github.com/user/core-insert', 'GITHUB', :owner_id)"
+            ),
+            {"owner_id": test_user.id}
         )
         
-        test_db.add(repository)
-        test_db.commit()
-        test_db.refresh(repository)
+        repository = test_db.query(Repository).filter(Repository.name == "core-insert").one()
         
-        assert repository.description is None
-        assert repository.default_branch == "main"
         assert repository.is_private is False
-        assert repository.provider == RepositoryProvider.GITHUB
         assert repository.is_active is True
-        assert repository.last_synced_at is None
-        assert repository.sync_status == "pending"
     
     def test_unique_external_id_constraint(self, test_db, test_user, repository_data):
         """Test that external_id can be duplicate (no unique constraint)"""
@@ -119,7 +143,6 @@ class TestRepositoryModel:
         test_repository.last_synced_at = sync_time
         test_repository.sync_status = "completed"
         test_db.commit()
-        test_db.refresh(test_repository)
         
         assert test_repository.last_synced_at == sync_time
         assert test_repository.sync_status == "completed"
@@ -173,30 +196,32 @@ class TestRepositoryModel:
         
         test_repository.is_active = False
         test_db.commit()
-        test_db.refresh(test_repository)
         
         assert test_repository.is_active is False
     
     def test_different_providers(self, test_db, test_user):
         """Test repositories from different providers"""
+        from app.models.repository import RepositoryProvider
         providers = ["github", "gitlab", "bitbucket"]
         
-        for provider in providers:
-            repository = Repository(
-                name=f"repo-{provider}",
-                url=f"https://{provider}.com/user/repo-{provider}",
-                provider=provider,
-                owner_id=test_user.id
-            )
-            test_db.add(repository)
-        
-        test_db.commit()
-        
+        result = test_db.execute(
+            insert(Repository).returning(Repository.provider),
+            [
+                {
+                    "name": f"repo-{provider}",
+                    "full_name": f"user/repo-{provider}",
+                    "url": f"https://{provider}.com/user/repo-{provider}",
+                    "provider": RepositoryProvider(provider),
+                    "owner_id": test_user.id
+                }
+                for provider in providers
+            ]
+        )
         # Verify all repositories were created with correct providers
-        repos = test_db.query(Repository).filter(Repository.owner_id == test_user.id).all()
-        assert len(repos) == 3
+        repo_providers = [provider.value for provider in result.scalars().all()]
+        test_db.commit()
         
-        repo_providers = [repo.provider for repo in repos]
+        assert len(repo_providers) == 3
         for provider in providers:
             assert provider in repo_providers
     
@@ -1,36 +1,72 @@
+import hashlib
 import pytest
 from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import raiseload
 from app.models.user import User
-from app.api.auth import get_password_hash, verify_password
+from app.api.auth import verify_password
+
+def _fake_hash(password):
+    """Cheap stand-in for bcrypt; these tests only need a non-null hashed_password"""
+    return "sha256$" + hashlib.sha256(password.encode()).hexdigest()
+
+@pytest.fixture
+def password_hasher(request, password_hasher):
+    """Skip bcrypt unless the test is marked real_bcrypt"""
+    if request.node.get_closest_marker("real_bcrypt"):
+        return password_hasher
+    return _fake_hash
+
+# Rows inserted once per module; usernames and emails stay clear of test_user_data
+# and of the users created by individual tests
+SEEDED_USERS = {
+    "create": {"username": "created_user", "email": "created@example.com", "full_name": "Created User"},
+    "defaults": {"username": "default_user", "email": "default@example.com"},
+    "github_token": {"username": "token_user", "email": "token@example.com", "github_token": "ghp_seededtoken123"},
+    "admin": {"username": "site_admin", "email": "site_admin@example.com", "is_admin": True},
+    "inactive": {"username": "inactive_user", "email": "inactive@example.com", "is_active": False},
+    "str": {"username": "str_user", "email": "str@example.com", "full_name": "Str User"},
+}
+
+@pytest.fixture(scope="module")
+def seeded_users(test_db_module):
+    """Insert every SEEDED_USERS row in a single batch, keyed like SEEDED_USERS"""
+    test_db_module.bulk_save_objects([
+        User(hashed_password=_fake_hash(fields["username"]), **fields)
+        for fields in SEEDED_USERS.values()
+    ])
+    test_db_module.commit()
+    
+    # bulk_save_objects leaves the instances untouched; read back what was stored.
+    # raiseload: a lazy relationship load in an assertion fails instead of querying
+    by_username = {
+        user.username: user
+        for user in test_db_module.query(User).options(raiseload("*")).filter(
+            User.username.in_([fields["username"] for fields in SEEDED_USERS.values()])
+        )
+    }
+    return {key: by_username[fields["username"]] for key, fields in SEEDED_USERS.items()}
 
 class TestUserModel:
     """Test cases for User model"""
     
-    def test_create_user(self, test_db, test_user_data):
+    def test_create_user(self, seeded_users):
         """Test creating a user"""
-        user = User(
-            username=test_user_data["username"],
-            email=test_user_data["email"],
-            hashed_password=get_password_hash(test_user_data["password"]),
-            full_name=test_user_data["full_name"]
-        )
-        
-        test_db.add(user)
-        test_db.commit()
-        test_db.refresh(user)
+        user = seeded_users["create"]
+        expected = SEEDED_USERS["create"]
         
         assert user.id is not None
-        assert user.username == test_user_data["username"]
-        assert user.email == test_user_data["email"]
-        assert user.full_name == test_user_data["full_name"]
+        assert user.username == expected["username"]
+        assert user.email == expected["email"]
+        assert user.full_name == expected["full_name"]
         assert user.is_active is True
         assert user.is_admin is False
         assert user.created_at is not None
     
-    def test_user_password_hashing(self, test_db):
+    @pytest.mark.real_bcrypt
+    def test_user_password_hashing(self, test_db, password_hasher):
         """Test password hashing and verification"""
         password = "test_password_123"
-        hashed = get_password_hash(password)
+        hashed = password_hasher(password)
         
         user = User(
             username="testuser",
@@ -45,123 +81,61 @@ class TestUserModel:
         assert verify_password(password, user.hashed_password)
         assert not verify_password("wrong_password", user.hashed_password)
     
-    def test_unique_username_constraint(self, test_db, test_user_data):
-        """Test that username must be unique"""
-        # Create first user
-        user1 = User(
-            username=test_user_data["username"],
-            email="user1@example.com",
-            hashed_password=get_password_hash("password1")
-        )
-        test_db.add(user1)
-        test_db.commit()
-        
-        # Try to create second user with same username
-        user2 = User(
-            username=test_user_data["username"],  # Same username
-            email="user2@example.com",
-            hashed_password=get_password_hash("password2")
-        )
-        test_db.add(user2)
-        
-        with pytest.raises(IntegrityError):
-            test_db.commit()
-    
-    def test_unique_email_constraint(self, test_db, test_user_data):
-        """Test that email must be unique"""
-        # Create first user
-        user1 = User(
-            username="user1",
-            email=test_user_data["email"],
-            hashed_password=get_password_hash("password1")
-        )
-        test_db.add(user1)
+    @pytest.mark.parametrize("conflict_field", ["username", "email"])
+    def test_unique_constraint(self, test_db, test_user_data, password_hasher, conflict_field):
+        """Test that username and email must be unique"""
+        # Create first user; a plain INSERT, it never needs to be an ORM instance
+        test_db.bulk_insert_mappings(User, [{
+            "username": test_user_data["username"],
+            "email": test_user_data["email"],
+            "hashed_password": password_hasher("password1")
+        }])
         test_db.commit()
         
-        # Try to create second user with same email
-        user2 = User(
-            username="user2",
-            email=test_user_data["email"],  # Same email
-            hashed_password=get_password_hash("password2")
-        )
-        test_db.add(user2)
+        # Try to create second user sharing only the conflicting field
+        user2_fields = {"username": "user2", "email": "user2@example.com"}
+        user2_fields[conflict_field] = test_user_data[conflict_field]
+        user2 = User(hashed_password=password_hasher("password2"), **user2_fields)
         
+        # Flush inside a SAVEPOINT: the INSERT fails without ending the transaction
         with pytest.raises(IntegrityError):
-            test_db.commit()
+            with test_db.begin_nested():
+                test_db.add(user2)
+                test_db.flush()
     
-    def test_user_defaults(self, test_db):
+    def test_user_defaults(self, seeded_users):
         """Test default values for user fields"""
-        user = User(
-            username="testuser",
-            email="test@example.com",
-            hashed_password=get_password_hash("password")
-        )
-        
-        test_db.add(user)
-        test_db.commit()
-        test_db.refresh(user)
+        user = seeded_users["defaults"]
         
         assert user.is_active is True
         assert user.is_admin is False
         assert user.full_name is None
         assert user.github_token is None
     
-    def test_user_github_token(self, test_db, test_user_data):
+    def test_user_github_token(self, seeded_users):
         """Test storing GitHub token"""
-        user = User(
-            username=test_user_data["username"],
-            email=test_user_data["email"],
-            hashed_password=get_password_hash(test_user_data["password"]),
-            github_token=test_user_data["github_token"]
-        )
-        
-        test_db.add(user)
-        test_db.commit()
-        test_db.refresh(user)
+        user = seeded_users["github_token"]
         
-        assert user.github_token == test_user_data["github_token"]
+        assert user.github_token == SEEDED_USERS["github_token"]["github_token"]
     
-    def test_admin_user(self, test_db):
+    def test_admin_user(self, seeded_users):
         """Test admin user creation"""
-        admin = User(
-            username="admin",
-            email="admin@example.com",
-            hashed_password=get_password_hash("admin_password"),
-            is_admin=True
-        )
-        
-        test_db.add(admin)
-        test_db.commit()
-        test_db.refresh(admin)
+        admin = seeded_users["admin"]
         
         assert admin.is_admin is True
         assert admin.is_active is True
     
-    def test_inactive_user(self, test_db):
+    def test_inactive_user(self, seeded_users):
         """Test inactive user"""
-        user = User(
-            username="inactive_user",
-            email="inactive@example.com",
-            hashed_password=get_password_hash("password"),
-            is_active=False
-        )
-        
-        test_db.add(user)
-        test_db.commit()
-        test_db.refresh(user)
+        user = seeded_users["inactive"]
         
         assert user.is_active is False
     
-    def test_user_str_representation(self, test_db, test_user_data):
+    def test_user_str_representation(self, seeded_users):
         """Test user string representation"""
-        user = User(
-            username=test_user_data["username"],
-            email=test_user_data["email"],
-            hashed_password=get_password_hash(test_user_data["password"]),
-            full_name=test_user_data["full_name"]
-        )
+        user = seeded_users["str"]
         
         # The User model should have a meaningful string representation
         # This will pass if __str__ or __repr__ is properly implemented
         str_repr = str(user)
-        assert test_user_data["username"] in str_repr or test_user_data["email"] in str_repr
\ No newline at end of file
+        assert user.username in str_repr or user.email in str_repr
\ No newline at end of file
@@ -0,0 +1,126 @@
+import asyncio
+import httpx
+import pytest
+from datetime import datetime
+from types import SimpleNamespace
+from app.models.commit import Commit
+from app.models.repository import Repository, RepositoryProvider
+from app.background import tasks
+
+def _make_commit(repository_id, sha):
+    return Commit(
+        sha=sha,
+        message="test commit",
+        author_name="Test Author",
+        author_email="author@test.com",
+        commit_date=datetime.utcnow(),
+        repository_id=repository_id
+    )
+
+class TestMarkCommitsAnalyzed:
+    """Test cases for batched is_analyzed updates"""
+    
+    def test_marks_only_given_commits(self, test_db, test_repository):
+        """Test that only the listed commits are flagged as analyzed"""
+        commits = [_make_commit(test_repository.id, f"{i:040d}") for i in range(3)]
+        test_db.add_all(commits)
+        test_db.commit()
+        
+        tasks._mark_commits_analyzed(test_db, [commits[0].id, commits[2].id])
+        test_db.commit()
+        
+        flags = {
+            c.sha: c.is_analyzed
+            # The UPDATE bypasses the identity map, so reload the rows
+            for c in test_db.query(Commit).populate_existing().filter(Commit.repository_id == test_repository.id)
+        }
+        assert flags == {commits[0].sha: True, commits[1].sha: False, commits[2].sha: True}
+    
+    def test_chunks_large_id_lists(self, test_db, test_repository, monkeypatch):
+        """Test that ids are split into chunks of ANALYZED_UPDATE_CHUNK_SIZE"""
+        monkeypatch.setattr(tasks, "ANALYZED_UPDATE_CHUNK_SIZE", 2)
+        commits = [_make_commit(test_repository.id, f"{i:040d}") for i in range(5)]
+        test_db.add_all(commits)
+        test_db.commit()
+        commit_ids = [c.id for c in commits]
+        
+        statements = []
+        original_execute = test_db.execute
+        def recording_execute(statement, *args, **kwargs):
+            statements.append(statement)
+            return original_execute(statement, *args, **kwargs)
+        monkeypatch.setattr(test_db, "execute", recording_execute)
+        
+        tasks._mark_commits_analyzed(test_db, commit_ids)
+        test_db.commit()
+        
+        assert len(statements) == 3
+        assert test_db.query(Commit).filter(Commit.is_analyzed == True).count() == 5
+    
+    def test_empty_id_list_is_noop(self, test_db):
+        """Test that an empty id list issues no UPDATE"""
+        tasks._mark_commits_analyzed(test_db, [])
+
+
+def _detail(sha):
+    """Minimal GitHub commit detail payload"""
+    return {
+        "sha": sha,
+        "commit": {
+            "message": f"commit {sha[:7]}",
+            "author": {"name": "Sync Author", "email": "sync@test.com", "date": "2024-01-01T00:00:00Z"},
+            "committer": {"name": "Sync Author", "email": "sync@test.com"}
+        },
+        "files": [],
+        "parents": []
+    }
+
+@pytest.fixture
+def github_repository(test_db, test_user):
+    """Repository whose URL parses to owner/repo"""
+    repository = Repository(
+        name="repo",
+        full_name="owner/repo",
+        url="https://github.com/owner/repo",
+        provider=RepositoryProvider.GITHUB,
+        owner_id=test_user.id
+    )
+    test_db.add(repository)
+    test_db.flush()
+    return repository
+
+class TestSyncGitHubRepository:
+    """Test cases for streaming commit sync"""
+    
+    @pytest.mark.asyncio
+    async def test_commit_repeated_across_pages_is_stored_once(self, test_db, github_repository,
+                                                               mock_github_handler, monkeypatch):
+        """Test that a commit shifted onto the next page by a push is not inserted twice"""
+        sha_a, sha_b, sha_c = ("a" * 40, "b" * 40, "c" * 40)
+        # A push between page requests shifts the list, so sha_b shows up on both pages
+        pages = [[{"sha": sha_a}, {"sha": sha_b}], [{"sha": sha_b}, {"sha": sha_c}]]
+        detail_requests = []
+        
+        def handler(request):
+            path = request.url.path
+            if path == "/repos/owner/repo":
+                return httpx.Response(200, json={"default_branch": "main", "private": False})
+            if path == "/repos/owner/repo/commits":
+                page = int(request.url.params["page"])
+                return httpx.Response(200, json=pages[page - 1] if page <= len(pages) else [])
+            sha = path.rsplit("/", 1)[-1]
+            detail_requests.append(sha)
+            return httpx.Response(200, json=_detail(sha))
+        
+        async def fake_sleep(delay):
+            pass
+        
+        mock_github_handler(handler)
+        monkeypatch.setattr(asyncio, "sleep", fake_sleep)
+        task = SimpleNamespace(update_state=lambda **kwargs: None)
+        
+        await tasks._sync_github_repository(github_repository, test_db, task)
+        
+        stored = [sha for (sha,) in test_db.query(Commit.sha).filter(Commit.repository_id == github_repository.id)]
+        assert sorted(stored) == [sha_a, sha_b, sha_c]
+        assert detail_requests.count(sha_b) == 1